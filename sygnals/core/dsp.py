@@ -5,18 +5,47 @@ Core Digital Signal Processing (DSP) functions.
 
 Includes FFT, STFT, CQT, Correlation, PSD, Convolution, Windowing, Envelope Detection etc.
 Excludes specific filter implementations (see filters.py).
-Uses scipy.fft for FFT/IFFT, librosa for STFT/CQT, and scipy.signal for others where appropriate.
+Uses scipy.fft for FFT/IFFT, for the STFT (one batched rfft over strided frames,
+matching librosa.stft) and for FFT-based correlation (rfft/irfft), librosa for CQT,
+and scipy.signal for others where appropriate.
+
+Inputs are converted once on entry to C-contiguous floating point arrays; arrays
+already in that layout are used without copying, and results are returned in the
+dtype the transforms produce, without a further conversion. float32 / complex64
+inputs keep single precision throughout the FFT, STFT, CQT, convolution, correlation
+and Hilbert envelope paths (half the memory traffic of float64); any other dtype
+is computed in float64 / complex128.
+
+Importing this module does not change the scipy.fft backend. pyFFTW can be opted
+into with `set_fft_backend('pyfftw')` or `set_fft_backend('auto')` (pyFFTW if it is
+installed), or with the SYGNALS_FFT_BACKEND environment variable set to 'pyfftw' or
+'auto' at import time ('scipy', the default, leaves pocketfft in place). Either way
+the backend is registered process-wide, so it also applies to scipy, librosa and
+user code in the same process.
+
+With CuPy installed, compute_fft, compute_stft, apply_convolution and
+compute_correlation accept device='cuda' to run their transforms on the GPU with
+cuFFT (cupyx.scipy.fft). Host (NumPy) inputs give host results; CuPy array inputs
+give CuPy results, so data already on the GPU is never copied back.
 """
 
+import hashlib
 import logging
+import math
+import os
+import threading
+from functools import lru_cache
 # Import necessary types
-from typing import Tuple, Optional, Union, Literal, Any
+from typing import Dict, Tuple, List, Optional, Union, Literal, Any
 
 import numpy as np
 import librosa # Use librosa for STFT, CQT etc. for consistency and features
+import scipy.fft
+import scipy.sparse
+from numpy.lib.stride_tricks import sliding_window_view
 from numpy.typing import NDArray
-from scipy.fft import fft, ifft, fftfreq # Use scipy.fft for basic FFT/IFFT
-from scipy.signal import fftconvolve, get_window, hilbert, correlate, periodogram, welch
+from scipy.fft import fft, ifft, fftfreq, rfft, irfft, rfftfreq, next_fast_len # Use scipy.fft for basic FFT/IFFT
+from scipy.signal import fftconvolve, oaconvolve, get_window, correlate, periodogram, welch
 
 # Attempt absolute import for rms_energy at the top level
 # This is needed for the 'rms' method in amplitude_envelope
@@ -32,38 +61,354 @@ except ImportError:
         "RMS envelope calculation via amplitude_envelope(method='rms') will fail."
     )
 
+# Numba is optional (normally installed as a librosa dependency). It provides a fused,
+# multi-threaded loop for the RMS envelope on long signals.
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# CuPy is optional. It enables device='cuda' (cuFFT through cupyx.scipy.fft).
+try:
+    import cupy as cp
+    import cupyx.scipy.fft as cufft
+    _CUPY_AVAILABLE = True
+except ImportError:
+    _CUPY_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__) # Get logger for this module
 
+# --- FFT backend selection ---
+
+_FFT_BACKEND_ENV_VAR = "SYGNALS_FFT_BACKEND"
+_FFT_PLAN_KEEPALIVE_S = 60 # Seconds an unused pyFFTW plan stays in the interface cache
+
+def _configure_fft_backend(requested: Optional[str] = None) -> str:
+    """
+    Registers pyFFTW as the global scipy.fft backend if requested and available.
+
+    pyFFTW's interface cache keeps FFTW plans alive between calls, so repeated
+    transforms of the same shape skip the planning step.
+
+    Args:
+        requested: 'auto', 'pyfftw' or 'scipy'. If None, read from SYGNALS_FFT_BACKEND,
+                   which defaults to 'scipy': nothing is registered and the global
+                   scipy.fft backend is left untouched.
+
+    Returns:
+        Name of the active backend ('pyfftw' or 'scipy').
+    """
+    if requested is None:
+        requested = os.environ.get(_FFT_BACKEND_ENV_VAR, "scipy").strip().lower()
+        if requested not in ("auto", "pyfftw", "scipy"):
+            logger.warning(f"Unknown {_FFT_BACKEND_ENV_VAR} value '{requested}'. "
+                           "Expected 'auto', 'pyfftw' or 'scipy'. Using 'scipy'.")
+            requested = "scipy"
+    if requested == "scipy":
+        return "scipy"
+
+    try:
+        import pyfftw
+        import pyfftw.interfaces.scipy_fft
+    except ImportError:
+        if requested == "pyfftw":
+            logger.warning("pyFFTW backend requested but pyFFTW is not installed. "
+                           "Falling back to the default scipy.fft backend.")
+        return "scipy"
+
+    try:
+        pyfftw.interfaces.cache.enable()
+        pyfftw.interfaces.cache.set_keepalive_time(_FFT_PLAN_KEEPALIVE_S)
+        scipy.fft.set_global_backend(pyfftw.interfaces.scipy_fft)
+    except Exception as e:
+        logger.warning(f"Could not register pyFFTW as scipy.fft backend: {e}. "
+                       "Falling back to the default scipy.fft backend.")
+        return "scipy"
+    logger.debug("Using pyFFTW as scipy.fft backend (plan cache enabled).")
+    return "pyfftw"
+
+_FFT_BACKEND = _configure_fft_backend()
+
+def set_fft_backend(backend: Literal['auto', 'pyfftw', 'scipy'] = 'auto') -> str:
+    """
+    Selects the scipy.fft backend, process-wide.
+
+    'pyfftw' registers pyFFTW (with its plan cache) as the global scipy.fft backend,
+    'auto' does so only if pyFFTW is installed, and 'scipy' restores scipy's own
+    pocketfft backend. The global backend is shared by scipy.signal, librosa and any
+    other code in the process, not only by sygnals.
+
+    Args:
+        backend: 'auto' (default), 'pyfftw' or 'scipy'.
+
+    Returns:
+        Name of the active backend ('pyfftw' or 'scipy'). A warning is logged and
+        'scipy' returned if pyFFTW was requested but could not be registered.
+
+    Raises:
+        ValueError: If `backend` is not one of the accepted names.
+
+    Example:
+        >>> set_fft_backend('auto')
+        'pyfftw' # If pyFFTW is installed
+    """
+    global _FFT_BACKEND
+    if backend not in ('auto', 'pyfftw', 'scipy'):
+        raise ValueError(f"Invalid FFT backend '{backend}'. Choose 'auto', 'pyfftw' or 'scipy'.")
+    if backend == 'scipy':
+        scipy.fft.set_global_backend('scipy')
+        _FFT_BACKEND = 'scipy'
+    else:
+        _FFT_BACKEND = _configure_fft_backend(backend)
+    return _FFT_BACKEND
+
+# Input dtypes computed in their own precision; everything else is promoted to float64/complex128
+_NATIVE_FLOAT_DTYPES = (np.float32, np.float64, np.complex64, np.complex128)
+
+def _as_float_contig(a: Any) -> NDArray[Any]:
+    """
+    Returns `a` as a C-contiguous float32/float64/complex64/complex128 array.
+
+    Single and double precision inputs keep their dtype; any other dtype (integers,
+    float16, long double, ...) becomes float64, or complex128 if complex. Arrays
+    already in a valid layout are returned unchanged; anything else is copied once
+    here, so results never need a hidden conversion copy on the way out. Contiguous,
+    aligned buffers also let the FFT backends use their vectorized paths.
+    """
+    a = np.asarray(a)
+    if a.dtype.type in _NATIVE_FLOAT_DTYPES:
+        dtype = a.dtype
+    else:
+        dtype = np.complex128 if np.iscomplexobj(a) else np.float64
+    return np.asarray(a, dtype=dtype, order="C")
+
+def _as_common_float_contig(
+    a: Any,
+    b: Any
+) -> Tuple[NDArray[Any], NDArray[Any]]:
+    """Converts two operands with `_as_float_contig` and promotes them to a common dtype."""
+    a, b = _as_float_contig(a), _as_float_contig(b)
+    if a.dtype != b.dtype:
+        common = np.result_type(a, b)
+        a, b = a.astype(common), b.astype(common)
+    return a, b
+
+# --- Per-thread scratch buffers ---
+
+# Total bytes of work buffers kept per thread; larger requests are allocated per call
+_SCRATCH_MAX_BYTES = 8 * 1024 * 1024
+# Frames (or Welch segments) windowed and transformed per block in the blocked loops
+_FRAME_BLOCK_SIZE = 256
+_scratch = threading.local()
+
+def _get_scratch(shape: Tuple[int, ...], dtype: Any) -> NDArray[Any]:
+    """
+    Returns this thread's reusable work buffer for (shape, dtype); contents are undefined.
+
+    Only meant for fixed-size blocks (at most `_FRAME_BLOCK_SIZE` frames) in loops
+    that window and transform a signal block by block, so their shapes repeat across
+    calls regardless of the signal length; never request signal-sized buffers here.
+    The pool is capped at `_SCRATCH_MAX_BYTES` per thread, evicting the least recently
+    used buffers. A scratch buffer must never be returned to the caller or be an FFT
+    output (no overwrite_x=True on it), since the next call on the same thread reuses it.
+    """
+    dtype = np.dtype(dtype)
+    nbytes = math.prod(shape) * dtype.itemsize
+    if nbytes > _SCRATCH_MAX_BYTES:
+        return np.empty(shape, dtype=dtype)
+    buffers = _scratch.__dict__.setdefault("buffers", {})
+    key = (tuple(shape), dtype.str)
+    buffer = buffers.pop(key, None) # Re-inserted below as the most recently used entry
+    if buffer is None:
+        held = sum(b.nbytes for b in buffers.values())
+        while buffers and held + nbytes > _SCRATCH_MAX_BYTES:
+            held -= buffers.pop(next(iter(buffers))).nbytes
+        buffer = np.empty(shape, dtype=dtype)
+    buffers[key] = buffer
+    return buffer
+
+# --- Optional CUDA (CuPy) backend ---
+
+def _use_cuda(device: str) -> bool:
+    """
+    Validates a `device` argument and returns True if the work should run on the GPU.
+
+    Raises:
+        ValueError: If `device` is not 'cpu' or 'cuda'.
+        ImportError: If 'cuda' is requested but CuPy is not installed.
+    """
+    if device == 'cpu':
+        return False
+    if device != 'cuda':
+        raise ValueError(f"Invalid device '{device}'. Choose 'cpu' or 'cuda'.")
+    if not _CUPY_AVAILABLE:
+        raise ImportError("CuPy package is required for device='cuda'. Please install it "
+                          "(e.g. `pip install cupy-cuda12x`, matching your CUDA version).")
+    return True
+
+def _cuda_as_float_contig(a: Any) -> Tuple[Any, bool]:
+    """
+    Uploads `a` to the GPU as a C-contiguous float array (same dtype rules as `_as_float_contig`).
+
+    Returns the device array and whether `a` already was a CuPy array, which decides
+    whether results are handed back on the device or copied to host memory.
+    """
+    on_device = isinstance(a, cp.ndarray)
+    a = cp.asarray(a)
+    if a.dtype.type in _NATIVE_FLOAT_DTYPES:
+        dtype = a.dtype
+    else:
+        dtype = np.complex128 if a.dtype.kind == 'c' else np.float64
+    return cp.ascontiguousarray(a, dtype=dtype), on_device
+
+def _cuda_as_common_float_contig(a: Any, b: Any) -> Tuple[Any, Any, bool]:
+    """Two-operand `_cuda_as_float_contig` with a common dtype; on_device if either input was a CuPy array."""
+    (a, a_on_device), (b, b_on_device) = _cuda_as_float_contig(a), _cuda_as_float_contig(b)
+    if a.dtype != b.dtype:
+        common = np.result_type(a.dtype, b.dtype)
+        a, b = a.astype(common), b.astype(common)
+    return a, b, a_on_device or b_on_device
+
+def _cuda_result(a: Any, on_device: bool) -> Any:
+    """Returns a device array as is for CuPy callers, otherwise copies it to a NumPy array."""
+    return a if on_device else cp.asnumpy(a)
+
+def _cuda_fft(
+    data: Any,
+    fs: Union[int, float],
+    n: Optional[int],
+    window: Optional[str],
+    real: bool,
+    pad_to_fast: bool
+) -> Tuple[Any, Any]:
+    """`compute_fft` on the GPU. cuFFT plans are cached by CuPy's plan cache."""
+    data, on_device = _cuda_as_float_contig(data)
+    if data.ndim not in (1, 2):
+        raise ValueError("Input data must be a 1D array or a 2D array of signals (one per row).")
+    is_complex = data.dtype.kind == 'c'
+    if real and is_complex:
+        raise ValueError("real=True requires real-valued input data.")
+    if window:
+        try:
+            win = _window_array(window, data.shape[-1], fftbins=False,
+                                dtype=np.finfo(data.dtype).dtype.name)
+        except ValueError as e:
+            raise ValueError(f"Invalid window type '{window}': {e}") from e
+        data = data * cp.asarray(win)
+    if n is None:
+        n = data.shape[-1]
+    if pad_to_fast:
+        n = cufft.next_fast_len(n, real=not is_complex)
+    logger.debug(f"Computing {'real ' if real else ''}FFT on CUDA with N={n}, Fs={fs}")
+    if real:
+        spectrum = cufft.rfft(data, n=n, axis=-1)
+        freqs = cufft.rfftfreq(n, d=1/fs)
+    else:
+        spectrum = cufft.fft(data, n=n, axis=-1)
+        freqs = cufft.fftfreq(n, d=1/fs)
+    return _cuda_result(freqs, on_device), _cuda_result(spectrum, on_device)
+
+def _cuda_stft(
+    y: Any,
+    n_fft: int,
+    hop_length: int,
+    win_length: int,
+    window: Any,
+    center: bool,
+    pad_mode: str
+) -> Any:
+    """Batched STFT on the GPU (same framing as `_stft_rfft`); returns a device array."""
+    fft_window = librosa.filters.get_window(window, win_length, fftbins=True)
+    fft_window = librosa.util.pad_center(fft_window, size=n_fft).astype(y.dtype, copy=False)
+    if center:
+        y = cp.pad(y, n_fft // 2, mode=pad_mode)
+    num_frames = 1 + (y.shape[0] - n_fft) // hop_length
+    frames = cp.lib.stride_tricks.as_strided(
+        y, shape=(num_frames, n_fft), strides=(y.strides[0] * hop_length, y.strides[0])
+    )
+    return cufft.rfft(frames * cp.asarray(fft_window), n=n_fft, axis=-1).T
+
+def _cuda_convolve(
+    data: Any,
+    kernel: Any,
+    mode: Literal['full', 'valid', 'same']
+) -> Any:
+    """Linear convolution of two 1D device arrays with cuFFT (rfft/irfft for real inputs)."""
+    if data.size == 0 or kernel.size == 0:
+        return cp.empty(0, dtype=data.dtype) # Same as scipy.signal.fftconvolve
+    full_length = data.shape[0] + kernel.shape[0] - 1
+    if data.dtype.kind == 'c':
+        n_fft = cufft.next_fast_len(full_length)
+        spectrum = cufft.fft(data, n=n_fft) * cufft.fft(kernel, n=n_fft)
+        full = cufft.ifft(spectrum, n=n_fft, overwrite_x=True)[:full_length]
+    else:
+        n_fft = cufft.next_fast_len(full_length, real=True)
+        spectrum = cufft.rfft(data, n=n_fft) * cufft.rfft(kernel, n=n_fft)
+        full = cufft.irfft(spectrum, n=n_fft, overwrite_x=True)[:full_length]
+    return _trim_full_convolution(full, data.shape[0], kernel.shape[0], mode)
+
 # --- FFT-related functions ---
 
 def compute_fft(
     data: NDArray[np.float64],
     fs: Union[int, float] = 1.0,
     n: Optional[int] = None,
-    window: Optional[str] = "hann"
+    window: Optional[str] = "hann",
+    real: bool = False,
+    pad_to_fast: bool = False,
+    workers: int = -1,
+    device: Literal['cpu', 'cuda'] = 'cpu'
 ) -> Tuple[NDArray[np.float64], NDArray[np.complex128]]:
     """
     Computes the Fast Fourier Transform (FFT) of a real-valued signal using scipy.fft.
 
+    With `real=True` the one-sided spectrum is computed with scipy.fft.rfft, which
+    only produces the n//2 + 1 non-negative frequency bins and needs roughly half
+    the computation and memory of the full complex FFT.
+
+    A 2D input is treated as a batch of signals (one per row) and transformed with
+    a single vectorized FFT along the last axis, which is much faster than calling
+    this function once per row.
+
     Args:
-        data: Input time-domain signal (1D NumPy array of float64).
+        data: Input time-domain signal (1D NumPy array of float64), or a 2D array
+              of shape (num_signals, num_samples).
         fs: Sampling frequency of the signal (default: 1.0 Hz).
-        n: Length of the FFT. If None, uses the length of the data.
+        n: Length of the FFT. If None, uses the length of the data (last axis).
            If n > len(data), the data is zero-padded.
            If n < len(data), the data is truncated.
         window: Name of the window function to apply before FFT (e.g., 'hann', 'hamming').
                 Applied using scipy.signal.get_window. If None, no window is applied.
+        real: If True, return only the one-sided spectrum (scipy.fft.rfft) and the
+              matching non-negative frequencies (scipy.fft.rfftfreq). Requires real-valued
+              input. Use `compute_irfft` to invert it. Default: False (full spectrum).
+        pad_to_fast: If True, zero-pad the FFT length up to `scipy.fft.next_fast_len(n)`.
+                     Prime or near-prime lengths are much slower to transform than
+                     lengths with only small prime factors. The returned frequencies
+                     reflect the padded length (finer bin spacing). Default: False.
+        workers: Number of threads scipy.fft may use for the transform. The GIL is
+                 released while it runs. Negative values count back from the number
+                 of CPU cores (-1 uses all of them). Default: -1.
+        device: 'cpu' (default) or 'cuda'. 'cuda' runs the windowing and transform on the GPU with
+                cuFFT and requires CuPy. Results are CuPy arrays if the input is one,
+                NumPy arrays otherwise.
 
     Returns:
         A tuple containing:
         - freqs (NDArray[np.float64]): Array of frequencies corresponding to the FFT bins.
                                       Only positive frequencies up to Nyquist are typically relevant
-                                      for real input signals, but the full array is returned.
-        - spectrum (NDArray[np.complex128]): Complex-valued FFT result (full spectrum).
+                                      for real input signals, but the full array is returned
+                                      unless `real=True`.
+        - spectrum (NDArray[np.complex128]): Complex-valued FFT result (full spectrum, or
+                                             n//2 + 1 bins if `real=True`). For 2D input,
+                                             one spectrum per row; `freqs` is shared.
 
     Raises:
-        ValueError: If input data is not 1D or window type is invalid.
+        ValueError: If input data is not 1D or 2D, window type is invalid, `real=True`
+                    is used with complex input, or `device` is invalid.
+        ImportError: If `device='cuda'` is requested but CuPy is not installed.
         Exception: For other errors during FFT computation or windowing.
 
     Example:
@@ -76,56 +421,88 @@ def compute_fft(
         >>> print(f"Detected peak frequency: {freqs[peak_freq_index]:.2f} Hz")
         Detected peak frequency: 10.00 Hz
     """
-    if data.ndim != 1:
-        raise ValueError("Input data must be a 1D array.")
+    if _use_cuda(device):
+        return _cuda_fft(data, fs, n, window, real, pad_to_fast)
+    data = _as_float_contig(data)
+    if data.ndim not in (1, 2):
+        raise ValueError("Input data must be a 1D array or a 2D array of signals (one per row).")
+    if real and not np.isrealobj(data):
+        raise ValueError("real=True requires real-valued input data.")
 
     data_processed = data # Work on a copy if windowing or padding/truncating
+    owns_buffer = False # True once data_processed is a private buffer the FFT may overwrite
     if window:
         logger.debug(f"Applying '{window}' window before FFT.")
         try:
-            # Apply window using the dedicated function
-            data_processed = apply_window(data, window_type=window)
+            # Apply window using the dedicated function, writing into a private work buffer
+            buffer = np.empty_like(data)
+            data_processed = apply_window(data, window_type=window, out=buffer)
+            owns_buffer = True
         except ValueError as e:
             # Re-raise ValueError for invalid window type
             raise ValueError(f"Invalid window type '{window}': {e}") from e
         except Exception as e:
              logger.warning(f"Unexpected error applying window '{window}': {e}. Proceeding without window.")
              data_processed = data # Revert to original data on unexpected error
+             owns_buffer = False
 
     if n is None:
-        n = data_processed.shape[0]
-    elif n != data_processed.shape[0]:
-         logger.debug(f"Adjusting data length from {data_processed.shape[0]} to {n} for FFT.")
+        n = data_processed.shape[-1]
+    if pad_to_fast:
+        fast_n = next_fast_len(n, real=np.isrealobj(data_processed))
+        if fast_n != n:
+            logger.debug(f"Padding FFT length from {n} to fast length {fast_n}.")
+            n = fast_n
+    if n != data_processed.shape[-1]:
+         logger.debug(f"Adjusting data length from {data_processed.shape[-1]} to {n} for FFT.")
          # Padding or truncation happens implicitly in fft() if n differs from data length
 
-    logger.debug(f"Computing FFT with N={n}, Fs={fs}")
+    logger.debug(f"Computing {'real ' if real else ''}FFT with N={n}, Fs={fs}")
     try:
-        # Use scipy.fft.fft
-        spectrum = fft(data_processed, n=n)
-        # Use scipy.fft.fftfreq to get frequencies
-        freqs = fftfreq(n, d=1/fs)
+        if real:
+            # One-sided spectrum: only the n//2 + 1 non-negative frequency bins
+            spectrum = rfft(data_processed, n=n, axis=-1, workers=workers, overwrite_x=owns_buffer)
+            freqs = rfftfreq(n, d=1/fs)
+        else:
+            # Use scipy.fft.fft (the default workers=-1 lets the backend use all available cores).
+            # The caller's array is never overwritten, only our own windowed buffer.
+            spectrum = fft(data_processed, n=n, axis=-1, workers=workers, overwrite_x=owns_buffer)
+            # Use scipy.fft.fftfreq to get frequencies
+            freqs = fftfreq(n, d=1/fs)
     except Exception as e:
         logger.error(f"Error during FFT computation: {e}")
         raise
 
-    # Ensure output types are consistent
-    return freqs.astype(np.float64, copy=False), spectrum.astype(np.complex128, copy=False)
+    return freqs, spectrum
 
 def compute_ifft(
     spectrum: NDArray[np.complex128],
-    n: Optional[int] = None
+    n: Optional[int] = None,
+    workers: int = -1,
+    real: bool = False
 ) -> NDArray[np.float64]:
     """
     Computes the Inverse Fast Fourier Transform (IFFT) using scipy.fft.
 
     Assumes the input spectrum corresponds to a real-valued time-domain signal,
     meaning the spectrum should exhibit conjugate symmetry if it was derived
-    from a real signal. Returns the real part of the result.
+    from a real signal. Returns the real part of the result. When debug logging
+    is enabled for this module, a warning is logged if the discarded imaginary
+    part is significant.
+
+    With `real=True` the spectrum is treated as one-sided (e.g., from
+    `compute_fft(..., real=True)`) and inverted with `compute_irfft`. The spectrum
+    length alone is never used to guess this, since a zero-padded or truncated full
+    spectrum can have the same number of bins.
 
     Args:
         spectrum: Complex-valued frequency spectrum (complex128).
         n: Length of the inverse FFT. If None, uses the length of the spectrum.
            Should typically match the original FFT length `n` used to generate the spectrum.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
+        real: If True, `spectrum` is a one-sided spectrum (n//2 + 1 bins) of a real
+              signal; pass the original length as `n` to reconstruct odd lengths.
+              Default: False (full spectrum).
 
     Returns:
         Real-valued time-domain signal (float64).
@@ -140,6 +517,10 @@ def compute_ifft(
         >>> np.allclose(signal, reconstructed_signal)
         True
     """
+    if real:
+        # One-sided spectrum of a real signal
+        return compute_irfft(spectrum, n=n, workers=workers)
+    spectrum = _as_float_contig(spectrum)
     if spectrum.ndim != 1:
         raise ValueError("Input spectrum must be a 1D array.")
     if n is None:
@@ -148,22 +529,154 @@ def compute_ifft(
     logger.debug(f"Computing IFFT with N={n}")
     try:
         # Use scipy.fft.ifft
-        time_domain_signal = ifft(spectrum, n=n)
+        time_domain_signal = ifft(spectrum, n=n, workers=workers)
     except Exception as e:
         logger.error(f"Error during IFFT computation: {e}")
         raise
 
     # Return the real part, assuming the original signal was real
-    # Small imaginary parts might exist due to numerical precision
-    imag_part_max = np.max(np.abs(np.imag(time_domain_signal)))
-    if imag_part_max > 1e-9: # Threshold for warning
-         logger.warning(f"Significant imaginary part found in IFFT result (max abs: {imag_part_max:.2e}). "
-                        "Input spectrum might not have conjugate symmetry.")
-    return np.real(time_domain_signal).astype(np.float64, copy=False)
+    # Small imaginary parts might exist due to numerical precision. Checking costs two
+    # extra passes over the result, so it only runs when debug logging is enabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        imag_part_max = float(np.max(np.abs(time_domain_signal.imag), initial=0.0))
+        if imag_part_max > 1e-9: # Threshold for warning
+             logger.warning(f"Significant imaginary part found in IFFT result (max abs: {imag_part_max:.2e}). "
+                            "Input spectrum might not have conjugate symmetry.")
+    return time_domain_signal.real
+
+def compute_irfft(
+    spectrum: NDArray[np.complex128],
+    n: Optional[int] = None,
+    workers: int = -1
+) -> NDArray[np.float64]:
+    """
+    Computes the inverse of a one-sided FFT using scipy.fft.irfft.
+
+    Counterpart of `compute_fft(..., real=True)`. The negative-frequency half is
+    implied by conjugate symmetry, so the result is real-valued by construction.
+
+    Args:
+        spectrum: One-sided complex spectrum with n//2 + 1 bins (complex128).
+        n: Length of the output signal. If None, uses 2 * (len(spectrum) - 1),
+           which is only correct for even original lengths. Pass the original
+           FFT length to reconstruct odd-length signals.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
+
+    Returns:
+        Real-valued time-domain signal (float64).
+
+    Raises:
+        ValueError: If input spectrum is not 1D.
+        Exception: For errors during IRFFT computation.
+
+    Example:
+        >>> freqs, spectrum = compute_fft(signal, fs=fs, window=None, real=True)
+        >>> reconstructed_signal = compute_irfft(spectrum, n=len(signal))
+        >>> np.allclose(signal, reconstructed_signal)
+        True
+    """
+    spectrum = _as_float_contig(spectrum)
+    if spectrum.ndim != 1:
+        raise ValueError("Input spectrum must be a 1D array.")
+
+    logger.debug(f"Computing IRFFT with N={n}")
+    try:
+        time_domain_signal = irfft(spectrum, n=n, workers=workers)
+    except Exception as e:
+        logger.error(f"Error during IRFFT computation: {e}")
+        raise
+    return time_domain_signal
 
 
 # --- Time-Frequency Transforms ---
 
+# Padding modes librosa.stft rejects for center=True; those calls are left to librosa
+_STFT_UNSUPPORTED_PAD_MODES = ("wrap", "maximum", "mean", "median", "minimum")
+
+def _stft_frame_segments(
+    y: NDArray[np.float64],
+    n_fft: int,
+    hop_length: int,
+    center: bool,
+    pad_mode: str
+) -> List[NDArray[np.float64]]:
+    """
+    Returns consecutive (frames, n_fft) views that together hold every STFT frame in order.
+
+    With `center`, only the few frames overlapping the padding are built from small
+    padded copies of the signal's head and tail; all interior frames are a strided view
+    of `y` itself, so the signal is never copied into a padded array (the same
+    head/interior/tail split as librosa.stft). Supported pad modes only depend on the
+    samples next to each edge, so the result equals framing np.pad(y, n_fft // 2).
+    """
+    if not center:
+        return [sliding_window_view(y, n_fft)[::hop_length]]
+    pad = n_fft // 2
+    n = y.shape[0]
+    num_frames = 1 + (n + 2 * pad - n_fft) // hop_length
+    start_k = -(-pad // hop_length) # First frame lying entirely inside y
+    end_k = min(num_frames, (n + pad - n_fft) // hop_length + 1) # One past the last such frame
+    if n < n_fft or start_k >= end_k:
+        # Too short for interior frames: padding the whole signal is cheap
+        return [sliding_window_view(np.pad(y, pad, mode=pad_mode), n_fft)[::hop_length]]
+    segments = []
+    if start_k > 0:
+        # Reflection needs pad + 1 samples of the signal, even if the frames need fewer
+        head_length = max((start_k - 1) * hop_length + n_fft - pad, pad + 1)
+        head = np.pad(y[:head_length], (pad, 0), mode=pad_mode)
+        segments.append(sliding_window_view(head, n_fft)[::hop_length][:start_k])
+    interior = y[start_k * hop_length - pad:]
+    segments.append(sliding_window_view(interior, n_fft)[::hop_length][:end_k - start_k])
+    if end_k < num_frames:
+        tail_start = end_k * hop_length - pad
+        tail_from = min(tail_start, n - pad - 1)
+        tail = np.pad(y[tail_from:], (0, pad), mode=pad_mode)[tail_start - tail_from:]
+        segments.append(sliding_window_view(tail, n_fft)[::hop_length][:num_frames - end_k])
+    return segments
+
+def _stft_rfft(
+    y: NDArray[np.float64],
+    n_fft: int,
+    hop_length: int,
+    win_length: int,
+    window: Any,
+    center: bool,
+    pad_mode: str,
+    out: Optional[NDArray[np.complex128]] = None,
+    workers: int = -1,
+) -> NDArray[np.complex128]:
+    """
+    Batched STFT: a single rfft over strided (num_frames, n_fft) views of the signal.
+
+    Produces the same frames as librosa.stft (window padded to n_fft, signal padded
+    by n_fft // 2 on both sides if `center`), without per-frame copies or a padded
+    copy of the signal (see `_stft_frame_segments`). If `out` is
+    given, frames are transformed in blocks written straight into it, so temporaries
+    stay bounded by the block size instead of the full STFT matrix; the windowed
+    block is a per-thread scratch buffer reused across calls.
+    """
+    fft_window = librosa.filters.get_window(window, win_length, fftbins=True)
+    fft_window = librosa.util.pad_center(fft_window, size=n_fft).astype(y.dtype, copy=False)
+    segments = _stft_frame_segments(y, n_fft, hop_length, center, pad_mode)
+    num_frames = sum(frames.shape[0] for frames in segments)
+    if out is None:
+        # The window multiply materializes the strided views into one contiguous frame buffer
+        windowed = np.empty((num_frames, n_fft), dtype=y.dtype)
+        offset = 0
+        for frames in segments:
+            np.multiply(frames, fft_window, out=windowed[offset:offset + frames.shape[0]])
+            offset += frames.shape[0]
+        return rfft(windowed, n=n_fft, axis=-1, workers=workers).T
+    block = _get_scratch((min(_FRAME_BLOCK_SIZE, num_frames), n_fft), y.dtype)
+    offset = 0
+    for frames in segments:
+        for start in range(0, frames.shape[0], _FRAME_BLOCK_SIZE):
+            stop = min(start + _FRAME_BLOCK_SIZE, frames.shape[0])
+            windowed = np.multiply(frames[start:stop], fft_window, out=block[:stop - start])
+            out[:, offset + start:offset + stop] = rfft(windowed, n=n_fft, axis=-1, workers=workers).T
+        offset += frames.shape[0]
+    return out
+
 def compute_stft(
     y: NDArray[np.float64],
     n_fft: int = 2048,
@@ -172,13 +685,21 @@ def compute_stft(
     window: str = 'hann',
     center: bool = True,
     pad_mode: str = 'constant', # Default in librosa 0.10+
+    out: Optional[NDArray[np.complex128]] = None,
+    workers: int = -1,
+    device: Literal['cpu', 'cuda'] = 'cpu',
 ) -> NDArray[np.complex128]:
     """
-    Computes the Short-Time Fourier Transform (STFT) using librosa.
+    Computes the Short-Time Fourier Transform (STFT).
 
     STFT breaks down the signal into short, overlapping frames and computes the FFT
     for each frame, providing time-localized frequency information.
 
+    Frames are taken as a strided view of the signal and transformed with a single
+    batched scipy.fft.rfft call. The result matches librosa.stft; cases that
+    librosa rejects (unsupported `pad_mode`, signal shorter than `n_fft`) are
+    delegated to librosa.stft so its errors are preserved.
+
     Args:
         y: Input time-domain signal (1D float64).
         n_fft: Length of the FFT window. Determines frequency resolution.
@@ -192,14 +713,25 @@ def compute_stft(
                 at `y[t * hop_length]`. If False, frame `t` begins at `y[t * hop_length]`.
         pad_mode: Padding mode used if `center=True`. Default 'constant' pads with zeros.
                   See `numpy.pad` for other options.
+        out: Optional pre-allocated array of shape (1 + n_fft//2, num_frames) that receives
+             the result (complex128, or complex64 for float32 input). Reusing one buffer across calls (e.g., when
+             repeatedly analyzing a stream) avoids allocating a new STFT matrix each time.
+        workers: Number of threads scipy.fft may use for the frame transforms
+                 (-1: all CPU cores). Default: -1.
+        device: 'cpu' (default) or 'cuda'. 'cuda' transforms all frames on the GPU with
+                cuFFT and requires CuPy. The result is a CuPy array if `y` is one,
+                a NumPy array otherwise; `out` may be either.
 
     Returns:
         Complex-valued STFT matrix (shape: (1 + n_fft/2, num_frames)).
         Rows correspond to frequency bins, columns correspond to time frames.
+        If `out` is given, it is filled and returned.
 
     Raises:
-        ValueError: If input data is not 1D.
-        Exception: For errors during librosa STFT computation.
+        ValueError: If input data is not 1D, `hop_length` is not positive, `out` has
+                    the wrong shape or dtype, or `device` is invalid.
+        ImportError: If `device='cuda'` is requested but CuPy is not installed.
+        Exception: For errors during STFT computation.
 
     Example:
         >>> sr = 22050
@@ -208,26 +740,112 @@ def compute_stft(
         >>> print(stft_matrix.shape)
         (513, 173) # Example shape, depends on signal length and parameters
     """
+    cuda = _use_cuda(device)
+    if cuda:
+        y, on_device = _cuda_as_float_contig(y)
+    else:
+        y = _as_float_contig(y)
     if y.ndim != 1:
         raise ValueError("Input data must be a 1D array.")
     logger.debug(f"Computing STFT: n_fft={n_fft}, hop={hop_length}, win_len={win_length}, window={window}, center={center}")
+    if win_length is None:
+        win_length = n_fft
+    if hop_length is None:
+        hop_length = win_length // 4
+    if hop_length < 1:
+        raise ValueError(f"hop_length must be a positive integer, got {hop_length}.")
+    padded_length = y.shape[0] + (2 * (n_fft // 2) if center else 0)
+    use_librosa = (
+        (center and pad_mode in _STFT_UNSUPPORTED_PAD_MODES)
+        or padded_length < n_fft
+    )
+    if cuda and use_librosa:
+        raise ValueError("device='cuda' requires a signal of at least n_fft samples (after centering) "
+                         f"and a pad_mode other than {_STFT_UNSUPPORTED_PAD_MODES}.")
+    if out is not None and not use_librosa:
+        expected_shape = (1 + n_fft // 2, 1 + (padded_length - n_fft) // hop_length)
+        expected_dtype = np.result_type(y.dtype, np.complex64)
+        if out.shape != expected_shape or out.dtype != expected_dtype:
+            raise ValueError(f"STFT output buffer must be {expected_dtype} with shape {expected_shape}, "
+                             f"got {out.dtype} with shape {out.shape}.")
     try:
-        # Use librosa.stft
-        stft_matrix = librosa.stft(
-            y=y,
-            n_fft=n_fft,
-            hop_length=hop_length,
-            win_length=win_length,
-            window=window,
-            center=center,
-            pad_mode=pad_mode,
-        )
-        # Ensure output type
-        return stft_matrix.astype(np.complex128, copy=False)
+        if cuda:
+            stft_matrix = _cuda_stft(y, n_fft, hop_length, win_length, window, center, pad_mode)
+            if out is None:
+                return _cuda_result(stft_matrix, on_device)
+            if isinstance(out, cp.ndarray):
+                out[...] = stft_matrix
+            else:
+                cp.ascontiguousarray(stft_matrix).get(out=out)
+            return out
+        if not use_librosa:
+            return _stft_rfft(y, n_fft, hop_length, win_length, window, center, pad_mode,
+                              out=out, workers=workers)
+        # Use librosa.stft (it calls scipy.fft without a workers argument)
+        with scipy.fft.set_workers(workers):
+            stft_matrix = librosa.stft(
+                y=y,
+                n_fft=n_fft,
+                hop_length=hop_length,
+                win_length=win_length,
+                window=window,
+                center=center,
+                pad_mode=pad_mode,
+                out=out,
+            )
+        return stft_matrix
     except Exception as e:
         logger.error(f"Error computing STFT: {e}")
         raise
 
+# librosa.cqt keyword arguments the cached-kernel CQT understands (others use librosa.cqt)
+_CQT_KERNEL_KWARGS = ("tuning", "filter_scale", "norm", "sparsity", "window")
+
+@lru_cache(maxsize=16)
+def _cqt_kernels(
+    sr: float,
+    fmin: float,
+    n_bins: int,
+    bins_per_octave: int,
+    hop_length: int,
+    filter_scale: float = 1.0,
+    norm: Optional[float] = 1.0,
+    sparsity: float = 0.01,
+    window: Union[str, Tuple[Any, ...]] = "hann",
+    dtype: str = "complex128",
+) -> Tuple[scipy.sparse.csr_matrix, int, NDArray[np.float64]]:
+    """
+    Builds (and caches) the frequency-domain CQT filter bank at the full sampling rate.
+
+    Mirrors librosa's filter construction: wavelet filters normalized to the FFT
+    length, transformed with an FFT, truncated to the non-negative bins and
+    sparsified. Building the bank dominates the cost of a CQT, so it is cached
+    for repeated calls with the same parameters.
+
+    Returns:
+        Tuple of (sparse filter bank of shape (n_bins, n_fft//2 + 1), n_fft, filter lengths).
+    """
+    freqs = librosa.cqt_frequencies(n_bins=n_bins, fmin=fmin, bins_per_octave=bins_per_octave)
+    if freqs[-1] > sr / 2.0:
+        raise ValueError(f"Highest CQT bin frequency ({freqs[-1]:.2f} Hz) exceeds the Nyquist "
+                         f"frequency ({sr / 2.0:.2f} Hz). Reduce n_bins or fmin.")
+    # Same as librosa.vqt: a single bin cannot infer its bandwidth from its neighbours
+    alpha = None
+    if n_bins == 1:
+        r = 2.0 ** (1.0 / bins_per_octave)
+        alpha = (r ** 2 - 1) / (r ** 2 + 1)
+    basis, lengths = librosa.filters.wavelet(
+        freqs=freqs, sr=sr, filter_scale=filter_scale, norm=norm, pad_fft=True, window=window,
+        alpha=alpha
+    )
+    # Filters are padded to a power of 2; make sure the frames also cover the hop
+    n_fft = max(basis.shape[1], int(2 ** (1 + np.ceil(np.log2(hop_length)))))
+    basis *= lengths[:, np.newaxis] / float(n_fft)
+    fft_basis = fft(basis, n=n_fft, axis=1, workers=-1)[:, :n_fft // 2 + 1]
+    fft_basis = librosa.util.sparsify_rows(fft_basis, quantile=sparsity, dtype=np.dtype(dtype))
+    lengths.setflags(write=False)
+    return fft_basis, n_fft, lengths
+
 def compute_cqt(
     y: NDArray[np.float64],
     sr: int,
@@ -235,6 +853,7 @@ def compute_cqt(
     fmin: Optional[float] = None,
     n_bins: int = 84,
     bins_per_octave: int = 12,
+    method: Literal['librosa', 'kernel'] = 'librosa',
     **kwargs: Any # Other librosa.cqt args (tuning, filter_scale, norm, res_type etc.)
 ) -> NDArray[np.complex128]:
     """
@@ -243,6 +862,12 @@ def compute_cqt(
     CQT provides logarithmically spaced frequency bins, which is often useful for
     analyzing musical audio as it aligns well with musical pitch perception.
 
+    With `method='kernel'`, the CQT is computed at the full sampling rate as a cached
+    sparse filter bank applied to a single STFT (no per-octave resampling). The filter
+    bank is built once per parameter set, which makes repeated CQTs (frames, streams,
+    many files with the same settings) much faster. Results agree with librosa.cqt to
+    within about 2% in magnitude; the differences come from librosa's multirate resampling.
+
     Args:
         y: Input time-domain signal (1D float64).
         sr: Sampling rate.
@@ -250,13 +875,18 @@ def compute_cqt(
         fmin: Minimum frequency (Hz) for the lowest CQT bin. Defaults to C1 (~32.7 Hz) if None.
         n_bins: Total number of CQT frequency bins.
         bins_per_octave: Number of bins per octave. Determines frequency resolution within an octave.
+        method: 'librosa' (default) uses `librosa.cqt`. 'kernel' uses the cached full-rate
+                filter bank described above. It supports the `tuning`, `filter_scale`,
+                `norm=1`, `sparsity` and `window` kwargs (`tuning=None` estimates the tuning
+                from the signal, as librosa does); other kwargs, or unhashable values such
+                as an array window, fall back to 'librosa'.
         **kwargs: Additional arguments passed to `librosa.cqt` (e.g., `tuning`, `filter_scale`, `norm`, `res_type`).
 
     Returns:
         Complex-valued CQT matrix (shape: (n_bins, num_frames)).
 
     Raises:
-        ValueError: If input data is not 1D.
+        ValueError: If input data is not 1D, `method` is invalid, or the highest bin exceeds Nyquist.
         Exception: For errors during librosa CQT computation.
 
     Example:
@@ -266,11 +896,54 @@ def compute_cqt(
         >>> print(cqt_matrix.shape)
         (60, 44) # Example shape
     """
+    y = _as_float_contig(y)
     if y.ndim != 1:
         raise ValueError("Input data must be a 1D array.")
     if fmin is None:
         fmin = librosa.note_to_hz('C1') # Default to C1 if not specified
-    logger.debug(f"Computing CQT: sr={sr}, hop={hop_length}, fmin={fmin:.2f}, n_bins={n_bins}, bins_per_octave={bins_per_octave}, kwargs={kwargs}")
+    if method not in ('librosa', 'kernel'):
+        raise ValueError(f"Unsupported CQT method: {method}. Choose 'librosa' or 'kernel'.")
+    logger.debug(f"Computing CQT: sr={sr}, hop={hop_length}, fmin={fmin:.2f}, n_bins={n_bins}, bins_per_octave={bins_per_octave}, method={method}, kwargs={kwargs}")
+    if method == 'kernel':
+        kernel_kwargs = dict(kwargs)
+        tuning = kernel_kwargs.pop("tuning", 0.0)
+        unsupported = sorted(set(kernel_kwargs) - set(_CQT_KERNEL_KWARGS))
+        norm = kernel_kwargs.get("norm", 1)
+        try:
+            hash(tuple(kernel_kwargs.values())) # The filter bank cache needs hashable parameters
+            hashable = True
+        except TypeError:
+            hashable = False
+        if unsupported:
+            logger.warning(f"CQT method 'kernel' does not support {unsupported}. Using librosa.cqt instead.")
+        elif not hashable:
+            logger.warning("CQT method 'kernel' needs hashable filter parameters (e.g. a window name, "
+                           "not an array). Using librosa.cqt instead.")
+        elif norm is None or norm != 1:
+            # librosa normalizes each octave's filters at its downsampled rate; only the L1
+            # norm is invariant to that, so other norms would differ by up to sqrt(2) per octave
+            logger.warning(f"CQT method 'kernel' only supports norm=1, got norm={norm}. "
+                           "Using librosa.cqt instead.")
+        else:
+            try:
+                hop = 512 if hop_length is None else hop_length
+                if tuning is None:
+                    # Same as librosa.cqt: estimate the tuning deviation from the signal
+                    tuning = librosa.estimate_tuning(y=y, sr=sr, bins_per_octave=bins_per_octave)
+                fmin_tuned = float(fmin) * 2.0 ** (tuning / bins_per_octave)
+                fft_basis, n_fft, lengths = _cqt_kernels(
+                    float(sr), fmin_tuned, n_bins, bins_per_octave, hop,
+                    dtype=np.result_type(y.dtype, np.complex64).name, **kernel_kwargs
+                )
+                # Filters are already windowed, so frames use a rectangular window
+                stft_matrix = compute_stft(y, n_fft=n_fft, hop_length=hop, window='ones', center=True)
+                cqt_matrix = fft_basis @ stft_matrix
+                # Same per-bin scaling as librosa.cqt(scale=True)
+                cqt_matrix /= np.sqrt(lengths)[:, np.newaxis]
+                return cqt_matrix
+            except Exception as e:
+                logger.error(f"Error computing CQT: {e}")
+                raise
     try:
         # Use librosa.cqt
         cqt_matrix = librosa.cqt(
@@ -282,8 +955,7 @@ def compute_cqt(
             bins_per_octave=bins_per_octave,
             **kwargs
         )
-        # Ensure output type
-        return cqt_matrix.astype(np.complex128, copy=False)
+        return cqt_matrix
     except Exception as e:
         logger.error(f"Error computing CQT: {e}")
         raise
@@ -291,13 +963,109 @@ def compute_cqt(
 
 # --- Convolution-related functions ---
 
+# Kernels up to this many taps are convolved directly in the time domain (np.convolve)
+_DIRECT_CONV_MAX_KERNEL = 64
+# Kernels up to this many taps use overlap-add (scipy.signal.oaconvolve) on long signals,
+# i.e. when the data is at least _OACONV_MIN_LENGTH_RATIO times longer than the kernel
+_OACONV_MAX_KERNEL = 4096
+_OACONV_MIN_LENGTH_RATIO = 32
+
+# Kernel spectra kept for reuse, and the largest spectrum (in bytes) that is cached at all;
+# longer transforms are tied to one data length and rarely reused, so they are not kept
+_KERNEL_CACHE_MAX_ENTRIES = 16
+_KERNEL_CACHE_MAX_SPECTRUM_BYTES = 1024 * 1024
+_kernel_spectra: Dict[Tuple[bytes, str, int], NDArray[np.complex128]] = {}
+_kernel_spectra_lock = threading.Lock()
+
+def _cached_kernel_rfft(kernel: NDArray[np.float64], n_fft: int) -> NDArray[np.complex128]:
+    """
+    Returns the read-only rfft of a kernel, cached by a digest of its contents and the FFT length.
+
+    Keyed on the kernel contents (not object identity) so a mutated or reallocated
+    kernel can never hit a stale entry; the digest is computed from the array buffer
+    without copying it. Repeated filtering with the same kernel skips its transform.
+    Only spectra up to `_KERNEL_CACHE_MAX_SPECTRUM_BYTES` are cached, in an LRU of
+    `_KERNEL_CACHE_MAX_ENTRIES`, so the cache never holds more than a few MiB.
+    """
+    spectrum_bytes = (n_fft // 2 + 1) * np.result_type(kernel.dtype, np.complex64).itemsize
+    if spectrum_bytes > _KERNEL_CACHE_MAX_SPECTRUM_BYTES:
+        return rfft(kernel, n=n_fft)
+    kernel = np.ascontiguousarray(kernel)
+    key = (hashlib.blake2b(kernel, digest_size=16).digest(), kernel.dtype.str, n_fft)
+    with _kernel_spectra_lock:
+        spectrum = _kernel_spectra.pop(key, None)
+        if spectrum is not None:
+            _kernel_spectra[key] = spectrum # Mark as most recently used
+            return spectrum
+    spectrum = rfft(kernel, n=n_fft)
+    spectrum.setflags(write=False)
+    with _kernel_spectra_lock:
+        _kernel_spectra[key] = spectrum
+        while len(_kernel_spectra) > _KERNEL_CACHE_MAX_ENTRIES:
+            _kernel_spectra.pop(next(iter(_kernel_spectra)))
+    return spectrum
+
+def _centered(arr: NDArray[Any], new_size: int) -> NDArray[Any]:
+    """Returns the center `new_size` samples of a 1D array (as scipy.signal does for 'same'/'valid')."""
+    start = (arr.shape[0] - new_size) // 2
+    return arr[start:start + new_size]
+
+def _trim_full_convolution(
+    full: NDArray[Any],
+    data_len: int,
+    kernel_len: int,
+    mode: Literal['full', 'valid', 'same']
+) -> NDArray[Any]:
+    """Cuts a 'full' convolution down to `mode`, with scipy.signal's output sizes and centering."""
+    if mode == 'full':
+        return full
+    if mode == 'same':
+        return _centered(full, data_len)
+    if mode == 'valid':
+        return _centered(full, abs(data_len - kernel_len) + 1)
+    raise ValueError(f"Invalid convolution mode '{mode}'. Choose 'full', 'valid' or 'same'.")
+
+def _rfft_convolve(
+    data: NDArray[np.float64],
+    kernel: NDArray[np.float64],
+    mode: Literal['full', 'valid', 'same'],
+    cache_kernel: bool = True,
+    workers: int = -1
+) -> NDArray[np.float64]:
+    """
+    Linear convolution of two real 1D arrays via rfft/irfft at a fast transform length.
+
+    With `cache_kernel`, the kernel spectrum is taken from (and stored in) the kernel
+    cache; disable it for one-off kernels such as a second signal being correlated.
+    """
+    full_length = data.shape[0] + kernel.shape[0] - 1
+    n_fft = next_fast_len(full_length, real=True)
+    data_spectrum = rfft(data, n=n_fft, workers=workers)
+    if cache_kernel:
+        # workers is not part of the cache key; the cached transform picks it up from the context
+        with scipy.fft.set_workers(workers):
+            data_spectrum *= _cached_kernel_rfft(kernel, n_fft)
+    else:
+        data_spectrum *= rfft(kernel, n=n_fft, workers=workers)
+    full = irfft(data_spectrum, n=n_fft, workers=workers, overwrite_x=True)[:full_length]
+    return _trim_full_convolution(full, data.shape[0], kernel.shape[0], mode)
+
 def apply_convolution(
     data: NDArray[np.float64],
     kernel: NDArray[np.float64],
-    mode: Literal['full', 'valid', 'same'] = "same"
+    mode: Literal['full', 'valid', 'same'] = "same",
+    workers: int = -1,
+    device: Literal['cpu', 'cuda'] = 'cpu'
 ) -> NDArray[np.float64]:
     """
-    Applies 1D convolution using scipy.signal.fftconvolve (FFT-based method).
+    Applies 1D convolution, choosing the method from the kernel and signal lengths.
+
+    Short FIR kernels (up to 64 taps) are convolved directly with np.convolve, which
+    avoids the FFT setup entirely. Kernels up to 4096 taps applied to much longer
+    signals use overlap-add (scipy.signal.oaconvolve). Otherwise real inputs are
+    convolved with rfft/irfft at a fast (`next_fast_len`) transform length, and the
+    kernel spectrum is cached so repeated calls with the same kernel only transform
+    the data. Complex or empty inputs use scipy.signal.fftconvolve.
 
     Convolution is used for filtering, smoothing, edge detection, etc.
 
@@ -308,12 +1076,16 @@ def apply_convolution(
               - 'full': Returns the full discrete linear convolution. Output size is N+M-1.
               - 'valid': Returns only parts that do not rely on zero-padding. Output size is max(N, M) - min(N, M) + 1.
               - 'same': Returns output of the same size as `data`, centered.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
+        device: 'cpu' (default) or 'cuda'. 'cuda' always convolves via cuFFT on the GPU and
+                requires CuPy. The result is a CuPy array if either input is one.
 
     Returns:
         The result of the convolution (float64).
 
     Raises:
-        ValueError: If input data or kernel is not 1D.
+        ValueError: If input data or kernel is not 1D, or `device` is invalid.
+        ImportError: If `device='cuda'` is requested but CuPy is not installed.
         Exception: For errors during convolution.
 
     Example:
@@ -323,14 +1095,33 @@ def apply_convolution(
         >>> print(result)
         [ 0.  1.  0.  0. -1.  0.  0.]
     """
+    cuda = _use_cuda(device)
+    if cuda:
+        data, kernel, on_device = _cuda_as_common_float_contig(data, kernel)
+    else:
+        data, kernel = _as_common_float_contig(data, kernel)
     if data.ndim != 1 or kernel.ndim != 1:
         raise ValueError("Input data and kernel must be 1D arrays.")
     logger.debug(f"Applying convolution with kernel size {kernel.shape[0]}, mode='{mode}'")
     try:
-        # Use scipy.signal.fftconvolve for potentially better performance on large arrays
-        result = fftconvolve(data, kernel, mode=mode)
-        # Ensure output type
-        return result.astype(np.float64, copy=False)
+        if cuda:
+            return _cuda_result(_cuda_convolve(data, kernel, mode), on_device)
+        if 0 < kernel.size <= _DIRECT_CONV_MAX_KERNEL and data.size > 0:
+            # Time-domain sum, trimmed like scipy (np.convolve's 'same' follows the longer input)
+            full = np.convolve(data, kernel, mode='full')
+            result = _trim_full_convolution(full, data.shape[0], kernel.shape[0], mode)
+        elif (0 < kernel.size <= _OACONV_MAX_KERNEL
+                and data.size >= _OACONV_MIN_LENGTH_RATIO * kernel.size):
+            with scipy.fft.set_workers(workers):
+                result = oaconvolve(data, kernel, mode=mode)
+        elif np.isrealobj(data) and np.isrealobj(kernel) and data.size > 0 and kernel.size > 0:
+            result = _rfft_convolve(data, kernel, mode, workers=workers)
+        else:
+            # Use scipy.signal.fftconvolve for potentially better performance on large arrays.
+            # It has no workers argument, so the thread count is set for the call instead.
+            with scipy.fft.set_workers(workers):
+                result = fftconvolve(data, kernel, mode=mode)
+        return result
     except Exception as e:
         logger.error(f"Error during convolution: {e}")
         raise
@@ -338,18 +1129,28 @@ def apply_convolution(
 
 # --- Correlation ---
 
+# With method='auto', sequences at least this long (both of them) use the rfft path
+_FFT_CORRELATION_MIN_LEN = 64
+
 def compute_correlation(
     x: NDArray[np.float64],
     y: NDArray[np.float64],
     mode: Literal['full', 'valid', 'same'] = 'full',
-    method: Literal['auto', 'direct', 'fft'] = 'auto'
+    method: Literal['auto', 'direct', 'fft'] = 'auto',
+    workers: int = -1,
+    device: Literal['cpu', 'cuda'] = 'cpu'
 ) -> NDArray[np.float64]:
     """
-    Computes the cross-correlation of two 1-dimensional sequences using scipy.signal.correlate.
+    Computes the cross-correlation of two 1-dimensional sequences using real FFTs or scipy.signal.correlate.
 
     Cross-correlation measures the similarity between two signals as a function of the
     time lag applied to one of them.
 
+    For real inputs with method 'fft' (or 'auto' when both sequences have at least
+    64 samples), the correlation is computed as a convolution with the reversed
+    `y` using real FFTs (rfft/irfft), which halves the transform work compared to
+    complex FFTs. Other cases use scipy.signal.correlate.
+
     Args:
         x: First input sequence (1D float64).
         y: Second input sequence (1D float64).
@@ -357,13 +1158,18 @@ def compute_correlation(
               Determines the size of the output array based on overlap.
         method: Computation method ('auto', 'direct', 'fft'). 'auto' chooses the fastest.
                 'fft' uses FFT-based correlation, 'direct' uses direct summation. Default: 'auto'.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
+        device: 'cpu' (default) or 'cuda'. 'cuda' always correlates via cuFFT on the GPU
+                (`method` is ignored) and requires CuPy. The result is a CuPy array if
+                either input is one.
 
     Returns:
         Cross-correlation result (float64). The interpretation of lags depends on the `mode`.
         For 'full', the zero lag corresponds to the center element.
 
     Raises:
-        ValueError: If input sequences are not 1D.
+        ValueError: If input sequences are not 1D, or `device` is invalid.
+        ImportError: If `device='cuda'` is requested but CuPy is not installed.
         Exception: For errors during correlation computation.
 
     Example:
@@ -375,14 +1181,30 @@ def compute_correlation(
         >>> print(f"Peak correlation at lag: {peak_lag}")
         Peak correlation at lag: 1
     """
+    cuda = _use_cuda(device)
+    if cuda:
+        x, y, on_device = _cuda_as_common_float_contig(x, y)
+    else:
+        x, y = _as_common_float_contig(x, y)
     if x.ndim != 1 or y.ndim != 1:
         raise ValueError("Input sequences for correlation must be 1D arrays.")
     logger.debug(f"Computing cross-correlation: mode='{mode}', method='{method}'")
+    if cuda:
+        # Correlation is convolution with the conjugated, time-reversed second sequence
+        return _cuda_result(_cuda_convolve(x, y[::-1].conj(), mode), on_device)
+    use_rfft = (
+        np.isrealobj(x) and np.isrealobj(y) and x.size > 0 and y.size > 0
+        and (method == 'fft'
+             or (method == 'auto' and min(x.size, y.size) >= _FFT_CORRELATION_MIN_LEN))
+    )
     try:
+        if use_rfft:
+            # Correlation is convolution with the time-reversed second sequence
+            return _rfft_convolve(x, y[::-1], mode, cache_kernel=False, workers=workers)
         # Use scipy.signal.correlate
-        correlation = correlate(x, y, mode=mode, method=method)
-        # Ensure output type
-        return correlation.astype(np.float64, copy=False)
+        with scipy.fft.set_workers(workers):
+            correlation = correlate(x, y, mode=mode, method=method)
+        return correlation
     except Exception as e:
         logger.error(f"Error computing correlation: {e}")
         raise
@@ -390,7 +1212,9 @@ def compute_correlation(
 def compute_autocorrelation(
     x: NDArray[np.float64],
     mode: Literal['full', 'valid', 'same'] = 'full',
-    method: Literal['auto', 'direct', 'fft'] = 'auto'
+    method: Literal['auto', 'direct', 'fft'] = 'auto',
+    workers: int = -1,
+    device: Literal['cpu', 'cuda'] = 'cpu'
 ) -> NDArray[np.float64]:
     """
     Computes the auto-correlation of a 1-dimensional sequence using scipy.signal.correlate.
@@ -402,6 +1226,8 @@ def compute_autocorrelation(
         x: Input sequence (1D float64).
         mode: Correlation mode ('full', 'valid', 'same'). Default: 'full'.
         method: Computation method ('auto', 'direct', 'fft'). Default: 'auto'.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
+        device: 'cpu' (default) or 'cuda' (see `compute_correlation`).
 
     Returns:
         Auto-correlation result (float64). For 'full' mode, the center element
@@ -426,18 +1252,78 @@ def compute_autocorrelation(
     """
     logger.debug(f"Computing auto-correlation: mode='{mode}', method='{method}'")
     # Autocorrelation is correlation with itself
-    return compute_correlation(x, x, mode=mode, method=method)
+    return compute_correlation(x, x, mode=mode, method=method, workers=workers, device=device)
 
 
 # --- Power Spectral Density (PSD) ---
 
+def _psd_welch_fused(
+    x: NDArray[np.float64],
+    fs: float,
+    window: Union[str, Tuple[Any, ...]],
+    nperseg: int,
+    noverlap: int,
+    nfft: int,
+    detrend: Union[str, bool],
+    scaling: Literal['density', 'spectrum'],
+    workers: int = -1
+) -> Optional[Tuple[NDArray[np.float64], NDArray[np.float64]]]:
+    """
+    One-sided Welch PSD with detrending and windowing fused into one vectorized pass.
+
+    Segments are a strided view of `x`; blocks of segments have their mean removed
+    and the window applied into a per-thread scratch block, which is transformed with
+    one batched rfft and accumulated, so memory stays bounded by the block. Matches
+    scipy.signal.welch (average='mean') for constant or no detrending and named
+    windows. Returns None for configurations it does not handle (linear or custom
+    detrending, array windows, short or complex input, invalid overlap/nfft) so
+    the caller can defer to scipy, including scipy's warnings and errors.
+    """
+    if (detrend not in ('constant', False) or not isinstance(window, (str, tuple))
+            or not np.isrealobj(x) or not 0 < nperseg <= x.shape[0]
+            or not 0 <= noverlap < nperseg or nfft < nperseg
+            or scaling not in ('density', 'spectrum')):
+        return None
+    win = _window_array(window, nperseg, fftbins=True)
+    step = nperseg - noverlap
+    segments = sliding_window_view(x, nperseg)[::step]
+    num_segments = segments.shape[0]
+    dtype = np.result_type(segments.dtype, win.dtype)
+    if num_segments == 1:
+        block = np.empty((1, nperseg), dtype=dtype) # Periodogram: signal-sized, not pooled
+    else:
+        block = _get_scratch((min(_FRAME_BLOCK_SIZE, num_segments), nperseg), dtype)
+    Pxx = np.zeros(nfft // 2 + 1, dtype=dtype)
+    for start in range(0, num_segments, _FRAME_BLOCK_SIZE):
+        chunk = segments[start:start + _FRAME_BLOCK_SIZE]
+        windowed = block[:chunk.shape[0]]
+        if detrend == 'constant':
+            np.subtract(chunk, chunk.mean(axis=-1, keepdims=True), out=windowed)
+            windowed *= win
+        else:
+            np.multiply(chunk, win, out=windowed)
+        spectra = rfft(windowed, n=nfft, axis=-1, workers=workers)
+        Pxx += (spectra.real ** 2 + spectra.imag ** 2).sum(axis=0)
+    Pxx /= num_segments
+    if scaling == 'density':
+        Pxx *= 1.0 / (fs * np.sum(win ** 2))
+    else:
+        Pxx *= 1.0 / np.sum(win) ** 2
+    # Fold negative frequencies into the one-sided estimate (DC and Nyquist appear once)
+    if nfft % 2:
+        Pxx[1:] *= 2
+    else:
+        Pxx[1:-1] *= 2
+    return rfftfreq(nfft, d=1/fs), Pxx
+
 def compute_psd_periodogram(
     x: NDArray[np.float64],
     fs: float = 1.0,
     window: str = 'hann',
     nfft: Optional[int] = None,
     detrend: Union[str, bool] = 'constant',
-    scaling: Literal['density', 'spectrum'] = 'density'
+    scaling: Literal['density', 'spectrum'] = 'density',
+    workers: int = -1
 ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
     """
     Estimates Power Spectral Density using Periodogram method (scipy.signal.periodogram).
@@ -445,6 +1331,10 @@ def compute_psd_periodogram(
     The periodogram is the squared magnitude of the FFT, normalized. It provides a basic
     estimate of the power distribution across frequencies but can be noisy.
 
+    For named windows with 'constant' or no detrending, the estimate is computed
+    directly with a fused detrend-and-window pass (same result as scipy); other
+    configurations use scipy.signal.periodogram.
+
     Args:
         x: Input time series (1D float64).
         fs: Sampling frequency (Hz).
@@ -453,6 +1343,7 @@ def compute_psd_periodogram(
         detrend: Specifies how to detrend `x` before FFT ('constant', 'linear', False). Default: 'constant'.
         scaling: 'density' returns Power Spectral Density (units V**2/Hz).
                  'spectrum' returns Power Spectrum (units V**2). Default: 'density'.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
 
     Returns:
         Tuple containing:
@@ -476,16 +1367,24 @@ def compute_psd_periodogram(
         raise ValueError("Input data must be a 1D array.")
     logger.debug(f"Computing PSD (Periodogram): fs={fs}, window={window}, nfft={nfft}, detrend={detrend}, scaling={scaling}")
     try:
+        # Same segment setup as scipy.signal.periodogram: one segment, no overlap
+        if nfft is None or nfft >= x.shape[0]:
+            fused = _psd_welch_fused(x, fs, window, x.shape[0], 0, nfft or x.shape[0], detrend, scaling, workers)
+        else:
+            fused = _psd_welch_fused(x[:nfft], fs, window, nfft, 0, nfft, detrend, scaling, workers)
+        if fused is not None:
+            return fused
         # Use scipy.signal.periodogram
-        frequencies, Pxx = periodogram(
-            x,
-            fs=fs,
-            window=window,
-            nfft=nfft,
-            detrend=detrend,
-            return_onesided=True, # Typically want one-sided for real signals
-            scaling=scaling
-        )
+        with scipy.fft.set_workers(workers):
+            frequencies, Pxx = periodogram(
+                x,
+                fs=fs,
+                window=window,
+                nfft=nfft,
+                detrend=detrend,
+                return_onesided=True, # Typically want one-sided for real signals
+                scaling=scaling
+            )
         # Ensure output types
         return frequencies.astype(np.float64, copy=False), Pxx.astype(np.float64, copy=False)
     except Exception as e:
@@ -500,7 +1399,8 @@ def compute_psd_welch(
     noverlap: Optional[int] = None,
     nfft: Optional[int] = None,
     detrend: Union[str, bool] = 'constant',
-    scaling: Literal['density', 'spectrum'] = 'density'
+    scaling: Literal['density', 'spectrum'] = 'density',
+    workers: int = -1
 ) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
     """
     Estimates Power Spectral Density using Welch's method (scipy.signal.welch).
@@ -508,6 +1408,10 @@ def compute_psd_welch(
     Welch's method improves upon the periodogram by averaging the periodograms
     of overlapping segments of the signal, reducing noise/variance.
 
+    For named windows with 'constant' or no detrending, segments are detrended,
+    windowed and transformed in a single vectorized pass (same result as scipy);
+    other configurations use scipy.signal.welch.
+
     Args:
         x: Input time series (1D float64).
         fs: Sampling frequency (Hz).
@@ -518,6 +1422,7 @@ def compute_psd_welch(
         nfft: Length of the FFT used for each segment. Defaults to nperseg.
         detrend: Specifies how to detrend each segment ('constant', 'linear', False). Default: 'constant'.
         scaling: 'density' (V**2/Hz) or 'spectrum' (V**2). Default: 'density'.
+        workers: Number of threads scipy.fft may use (-1: all CPU cores). Default: -1.
 
     Returns:
         Tuple containing:
@@ -541,18 +1446,28 @@ def compute_psd_welch(
         raise ValueError("Input data must be a 1D array.")
     logger.debug(f"Computing PSD (Welch): fs={fs}, window={window}, nperseg={nperseg}, noverlap={noverlap}, nfft={nfft}, detrend={detrend}, scaling={scaling}")
     try:
-        # Use scipy.signal.welch
-        frequencies, Pxx = welch(
-            x,
-            fs=fs,
-            window=window,
-            nperseg=nperseg,
-            noverlap=noverlap,
-            nfft=nfft,
-            detrend=detrend,
-            return_onesided=True, # Typically want one-sided for real signals
-            scaling=scaling
+        seg_len = 256 if nperseg is None else nperseg
+        fused = _psd_welch_fused(
+            x, fs, window, seg_len,
+            seg_len // 2 if noverlap is None else noverlap,
+            seg_len if nfft is None else nfft,
+            detrend, scaling, workers
         )
+        if fused is not None:
+            return fused
+        # Use scipy.signal.welch
+        with scipy.fft.set_workers(workers):
+            frequencies, Pxx = welch(
+                x,
+                fs=fs,
+                window=window,
+                nperseg=nperseg,
+                noverlap=noverlap,
+                nfft=nfft,
+                detrend=detrend,
+                return_onesided=True, # Typically want one-sided for real signals
+                scaling=scaling
+            )
         # Ensure output types
         return frequencies.astype(np.float64, copy=False), Pxx.astype(np.float64, copy=False)
     except Exception as e:
@@ -562,11 +1477,48 @@ def compute_psd_welch(
 
 # --- Envelope Detection ---
 
+# Minimum frame_length * n_frames for which the Numba RMS loop is used instead of rms_energy
+_RMS_NUMBA_MIN_WORK = 1_000_000
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rms_envelope_numba(y, frame_length, hop_length, n_frames, out):
+        """Per-frame RMS in one pass over the input (square, mean and sqrt fused)."""
+        for i in prange(n_frames):
+            acc = 0.0
+            base = i * hop_length
+            for j in range(frame_length):
+                v = y[base + j]
+                acc += v * v
+            out[i] = math.sqrt(acc / frame_length)
+        return out
+
+def _analytic_signal(y: NDArray[np.float64], pad_to_fast: bool = False) -> NDArray[np.complex128]:
+    """
+    Computes the analytic signal y + j*hilbert(y) from a one-sided rfft.
+
+    Equivalent to scipy.signal.hilbert, but only the real FFT of the input is
+    computed. With `pad_to_fast`, the transform length is rounded up to
+    `next_fast_len` so prime lengths avoid the slow FFT path; the input is then
+    treated as zero-extended rather than periodic, which changes the result
+    (mostly near the edges) compared with scipy.signal.hilbert.
+    """
+    n = y.shape[0]
+    m = next_fast_len(n, real=True) if pad_to_fast else n
+    half_spectrum = rfft(y, n=m, workers=-1)
+    # Build the analytic spectrum: keep DC (and Nyquist for even m), double positive
+    # frequencies, zero negative frequencies
+    spectrum = np.zeros(m, dtype=half_spectrum.dtype)
+    spectrum[:half_spectrum.shape[0]] = half_spectrum
+    spectrum[1:(m + 1) // 2] *= 2
+    return ifft(spectrum, n=m, workers=-1, overwrite_x=True)[:n]
+
 def amplitude_envelope(
     y: NDArray[np.float64],
     method: Literal['hilbert', 'rms'] = 'hilbert',
     frame_length: Optional[int] = None, # Required for RMS method
-    hop_length: Optional[int] = None    # Required for RMS method
+    hop_length: Optional[int] = None,   # Required for RMS method
+    pad_to_fast: bool = False
 ) -> NDArray[np.float64]:
     """
     Computes the amplitude envelope of a signal.
@@ -581,6 +1533,11 @@ def amplitude_envelope(
                 envelope based on local energy. Requires `rms_energy` to be available.
         frame_length: Frame length in samples (required for 'rms' method).
         hop_length: Hop length in samples (required for 'rms' method).
+        pad_to_fast: 'hilbert' only. If True, zero-pad the FFT to `scipy.fft.next_fast_len`,
+                     which is much faster for prime or near-prime lengths. Padding replaces
+                     the periodic boundary of scipy.signal.hilbert by zero extension, so
+                     values differ from it, mainly near the start and end. Default: False
+                     (same result as scipy.signal.hilbert).
 
     Returns:
         Amplitude envelope (1D float64).
@@ -588,7 +1545,8 @@ def amplitude_envelope(
         - For 'rms', length corresponds to the number of frames.
 
     Raises:
-        ValueError: If input data is not 1D, method is invalid, or required parameters for 'rms' are missing.
+        ValueError: If input data is not 1D, method is invalid, or required parameters for 'rms' are
+                    missing or not positive.
         ImportError: If 'rms' method is chosen but `rms_energy` could not be imported.
         Exception: For errors during Hilbert or RMS calculation.
 
@@ -601,6 +1559,7 @@ def amplitude_envelope(
         >>> # env_hilbert will closely follow the exp(-t*5) decay
         >>> # env_rms will be a smoothed, frame-based version of the decay
     """
+    y = _as_float_contig(y)
     if y.ndim != 1:
         raise ValueError("Input data must be a 1D array.")
     logger.debug(f"Computing Amplitude Envelope using method: {method}")
@@ -609,9 +1568,9 @@ def amplitude_envelope(
         try:
             # Hilbert transform gives the analytic signal: y + j*hilbert(y)
             # The magnitude |y + j*hilbert(y)| is the instantaneous amplitude (envelope)
-            analytic_signal = hilbert(y)
+            analytic_signal = _analytic_signal(y, pad_to_fast=pad_to_fast)
             envelope = np.abs(analytic_signal)
-            return envelope.astype(np.float64, copy=False)
+            return envelope
         except Exception as e:
             logger.error(f"Error computing Hilbert envelope: {e}")
             raise
@@ -622,6 +1581,19 @@ def amplitude_envelope(
                                "Cannot compute RMS envelope.")
         if frame_length is None or hop_length is None:
             raise ValueError("frame_length and hop_length are required for 'rms' envelope method.")
+        if frame_length < 1 or hop_length < 1:
+            raise ValueError(f"frame_length and hop_length must be positive integers, "
+                             f"got frame_length={frame_length}, hop_length={hop_length}.")
+        # Frames are centered as in rms_energy(center=True): zero-pad frame_length // 2 on both sides
+        n_frames = 1 + (y.shape[0] + 2 * (frame_length // 2) - frame_length) // hop_length
+        if _NUMBA_AVAILABLE and n_frames > 0 and frame_length * n_frames >= _RMS_NUMBA_MIN_WORK:
+            try:
+                y_padded = np.pad(y, frame_length // 2, mode='constant')
+                rms_env = np.empty(n_frames, dtype=np.float64)
+                return _rms_envelope_numba(y_padded, frame_length, hop_length, n_frames, rms_env)
+            except Exception as e:
+                logger.error(f"Error computing RMS envelope: {e}")
+                raise
         try:
             # Use the imported RMS energy function
             # Note: RMS is related to envelope but not exactly the same as Hilbert envelope.
@@ -638,9 +1610,47 @@ def amplitude_envelope(
 
 # --- Window functions ---
 
+@lru_cache(maxsize=64)
+def _cached_window(
+    window_type: Union[str, Tuple[Any, ...]],
+    length: int,
+    fftbins: bool = False,
+    dtype: str = "float64"
+) -> NDArray[np.float64]:
+    """
+    Returns a read-only window array from scipy.signal.get_window, cached by its arguments.
+
+    The same window is typically requested repeatedly (per frame or per call), so
+    caching skips regenerating a deterministic array. The result is marked
+    read-only because it is shared between callers. `dtype` ('float32' or 'float64')
+    lets single precision signals be windowed without promotion to float64.
+    """
+    window = get_window(window_type, length, fftbins=fftbins).astype(dtype, copy=False)
+    window.setflags(write=False)
+    return window
+
+def _window_array(
+    window_type: Union[str, Tuple[Any, ...]],
+    length: int,
+    fftbins: bool = False,
+    dtype: str = "float64"
+) -> NDArray[np.float64]:
+    """
+    Returns `_cached_window(...)`, or an uncached window for unhashable specs.
+
+    Unhashable specs (e.g. a list) cannot key the cache; they go straight to
+    scipy.signal.get_window so invalid ones still raise its ValueError.
+    """
+    try:
+        hash(window_type)
+    except TypeError:
+        return get_window(window_type, length, fftbins=fftbins).astype(dtype, copy=False)
+    return _cached_window(window_type, length, fftbins, dtype)
+
 def apply_window(
     data: NDArray[np.float64],
-    window_type: str = "hann"
+    window_type: str = "hann",
+    out: Optional[NDArray[np.float64]] = None
 ) -> NDArray[np.float64]:
     """
     Applies a specified window function to the data using scipy.signal.get_window.
@@ -648,15 +1658,19 @@ def apply_window(
     Windowing is often applied before FFT to reduce spectral leakage.
 
     Args:
-        data: Input signal (1D NumPy array of float64).
+        data: Input signal (1D NumPy array of float64). A 2D array is treated as a
+              batch of signals and the window is applied to every row.
         window_type: Name of the window function (e.g., 'hann', 'hamming', 'blackman', 'bartlett').
                      See `scipy.signal.get_window` documentation for available types.
+        out: Optional array with the same shape as `data` that receives the windowed
+             signal (via `np.multiply(..., out=out)`), avoiding a new allocation.
+             May be `data` itself to window in place.
 
     Returns:
-        Windowed data (float64).
+        Windowed data (float64), or `out` if it was given.
 
     Raises:
-        ValueError: If input data is not 1D or window_type is invalid.
+        ValueError: If input data is not 1D or 2D, window_type is invalid, or `out` has the wrong shape.
         Exception: For other errors during window generation or application.
 
     Example:
@@ -667,20 +1681,26 @@ def apply_window(
         >>> print(windowed_signal[0], windowed_signal[-1]) # Hann window goes to zero at ends
         0.0 0.0
     """
-    if data.ndim != 1:
-        raise ValueError("Input data must be a 1D array.")
+    data = _as_float_contig(data)
+    if data.ndim not in (1, 2):
+        raise ValueError("Input data must be a 1D array or a 2D array of signals (one per row).")
+    if out is not None and out.shape != data.shape:
+        raise ValueError(f"Output buffer shape {out.shape} does not match data shape {data.shape}.")
     logger.debug(f"Applying '{window_type}' window.")
     try:
-        # Get the window function values
+        # Get the window function values (cached per window type and length)
         # fftbins=False ensures the window is symmetric and suitable for general signal processing
-        window = get_window(window_type, data.shape[0], fftbins=False)
+        window = _window_array(window_type, data.shape[-1], fftbins=False,
+                               dtype=np.finfo(data.dtype).dtype.name)
         # Ensure window length matches data length precisely (should match if fftbins=False)
-        if len(window) != len(data):
+        if len(window) != data.shape[-1]:
              # This case should be rare with fftbins=False but handle defensively
              raise ValueError(f"Internal error: Window length mismatch after get_window "
-                              f"(got {len(window)}, expected {len(data)}).")
-        # Apply window by element-wise multiplication
-        return (data * window).astype(np.float64, copy=False)
+                              f"(got {len(window)}, expected {data.shape[-1]}).")
+        # Apply window by element-wise multiplication (broadcast over rows for 2D input)
+        if out is not None:
+            return np.multiply(data, window, out=out)
+        return data * window
     except ValueError as e:
         # Specific error for invalid window type from get_window
         logger.error(f"Invalid window type '{window_type}': {e}")
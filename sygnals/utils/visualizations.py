@@ -182,6 +182,8 @@ def plot_fft_magnitude(
     try:
         logger.info(f"Generating FFT magnitude plot: sr={sr}, output={output_file}")
         # Compute FFT using the function from dsp module
+        # Only non-negative frequencies are plotted, so the one-sided (rfft) spectrum suffices
+        fft_kwargs.setdefault("real", True)
         freqs, spectrum = compute_fft(data, fs=sr, window=window, **fft_kwargs)
 
         # Calculate magnitude and select positive frequencies up to Nyquist
@@ -255,6 +257,8 @@ def plot_fft_phase(
     try:
         logger.info(f"Generating FFT phase plot: sr={sr}, unwrap={unwrap}, output={output_file}")
         # Compute FFT using the function from dsp module
+        # Only non-negative frequencies are plotted, so the one-sided (rfft) spectrum suffices
+        fft_kwargs.setdefault("real", True)
         freqs, spectrum = compute_fft(data, fs=sr, window=window, **fft_kwargs)
 
         # Calculate phase angle
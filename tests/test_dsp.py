@@ -11,10 +11,11 @@ from sygnals.core.audio.features import rms_energy
 
 # Functions to test
 from sygnals.core.dsp import (
-    compute_fft, compute_ifft, apply_convolution, apply_window,
+    compute_fft, compute_ifft, compute_irfft, apply_convolution, apply_window,
     compute_stft, compute_cqt, compute_correlation, compute_autocorrelation,
     compute_psd_periodogram, compute_psd_welch, amplitude_envelope
 )
+from sygnals.core.dsp import _CUPY_AVAILABLE
 from sygnals.core.transforms import hilbert_transform
 
 # --- Test Fixtures ---
@@ -65,6 +66,85 @@ def test_compute_fft_sine_wave(sine_wave):
     # Tolerance depends on FFT resolution (fs / len(x))
     assert abs(detected_freq - freq) < (fs / len(x)), f"Detected peak {detected_freq} Hz != expected {freq} Hz."
 
+def test_compute_fft_matches_numpy(random_signal):
+    """Test FFT result against numpy's reference implementation, whichever backend is active."""
+    x, fs = random_signal
+    freqs, spectrum = compute_fft(x, fs=fs, window=None)
+    assert_allclose(spectrum, np.fft.fft(x), atol=1e-9)
+    assert_allclose(freqs, np.fft.fftfreq(len(x), d=1/fs))
+
+def test_fft_backend_env_override(monkeypatch):
+    """Test that SYGNALS_FFT_BACKEND=scipy keeps the default scipy.fft backend."""
+    from sygnals.core import dsp
+    monkeypatch.setenv("SYGNALS_FFT_BACKEND", "scipy")
+    assert dsp._configure_fft_backend() == "scipy"
+
+def test_fft_backend_untouched_by_default(monkeypatch):
+    """Test that importing sygnals does not register a global scipy.fft backend."""
+    import scipy.fft
+    from sygnals.core import dsp
+    registered = []
+    monkeypatch.setattr(scipy.fft, "set_global_backend", registered.append)
+    monkeypatch.delenv("SYGNALS_FFT_BACKEND", raising=False)
+    assert dsp._configure_fft_backend() == "scipy" # What runs at import time
+    assert registered == []
+
+def test_fft_backend_falls_back_without_pyfftw(monkeypatch, caplog):
+    """Test that requesting pyFFTW without it installed keeps scipy's backend and warns."""
+    import sys
+    import scipy.fft
+    from sygnals.core import dsp
+    registered = []
+    monkeypatch.setattr(scipy.fft, "set_global_backend", registered.append)
+    monkeypatch.setitem(sys.modules, "pyfftw", None) # Makes `import pyfftw` raise ImportError
+    monkeypatch.setitem(sys.modules, "pyfftw.interfaces.scipy_fft", None)
+    monkeypatch.setenv("SYGNALS_FFT_BACKEND", "pyfftw")
+    assert dsp._configure_fft_backend() == "scipy"
+    assert "not installed" in caplog.text
+    assert dsp.set_fft_backend("auto") == "scipy"
+    assert registered == []
+    with pytest.raises(ValueError):
+        dsp.set_fft_backend("fftw")
+
+def test_compute_fft_batched_rows(random_signal):
+    """Test that a 2D batch gives the same spectra as per-row calls."""
+    x, fs = random_signal
+    batch = np.stack([x, x[::-1], 2 * x])
+    for real in (False, True):
+        freqs, spectra = compute_fft(batch, fs=fs, window='hann', real=real)
+        assert spectra.shape[0] == batch.shape[0]
+        for row, signal in zip(spectra, batch):
+            freqs_row, spectrum_row = compute_fft(signal, fs=fs, window='hann', real=real)
+            assert_allclose(row, spectrum_row, atol=1e-9)
+            assert_allclose(freqs, freqs_row)
+    with pytest.raises(ValueError):
+        compute_fft(batch[np.newaxis])
+
+def test_inputs_coerced_to_float64_once():
+    """Test that non-float64 inputs are converted on entry and results keep 64-bit precision."""
+    x_int = np.arange(16) # int64, converted to float64 on entry
+    freqs, spectrum = compute_fft(x_int, window=None)
+    assert freqs.dtype == np.float64
+    assert spectrum.dtype == np.complex128
+    assert compute_correlation(x_int, x_int).dtype == np.float64
+    assert apply_convolution(x_int, np.ones(3, dtype=np.int32)).dtype == np.float64
+    assert compute_ifft(spectrum).dtype == np.float64
+
+def test_float32_precision_preserved(random_signal):
+    """Test that single precision input stays single precision through the main transforms."""
+    x, fs = random_signal
+    x32 = x.astype(np.float32)
+    freqs, spectrum = compute_fft(x32, fs=fs)
+    assert spectrum.dtype == np.complex64
+    assert compute_ifft(spectrum).dtype == np.float32
+    assert compute_stft(x32, n_fft=256).dtype == np.complex64
+    assert apply_convolution(x32, np.ones(5, dtype=np.float32)).dtype == np.float32
+    assert apply_convolution(x32, np.ones(5)).dtype == np.float64 # Mixed precision promotes
+    assert compute_correlation(x32, x32).dtype == np.float32
+    envelope = amplitude_envelope(x32, method='hilbert')
+    assert envelope.dtype == np.float32
+    assert_allclose(envelope, amplitude_envelope(x, method='hilbert'), rtol=1e-3, atol=1e-4)
+
 # --- Test compute_ifft ---
 def test_compute_ifft_reconstruction(random_signal):
     """Test if IFFT correctly reconstructs the original signal."""
@@ -75,6 +155,120 @@ def test_compute_ifft_reconstruction(random_signal):
     assert x_reconstructed.shape == x.shape
     assert_allclose(x, x_reconstructed, atol=1e-9, rtol=1e-7) # High precision expected
 
+def test_compute_fft_real_roundtrip(random_signal):
+    """Test one-sided FFT against the full FFT and its inversion via compute_irfft."""
+    x, fs = random_signal
+    x = x[:-1] # Odd length exercises the explicit n handling
+    freqs_full, spectrum_full = compute_fft(x, fs=fs, window=None)
+    freqs, spectrum = compute_fft(x, fs=fs, window=None, real=True)
+    n_bins = len(x) // 2 + 1
+    assert spectrum.shape == (n_bins,)
+    assert_allclose(spectrum, spectrum_full[:n_bins], atol=1e-9)
+    assert_allclose(freqs, np.abs(freqs_full[:n_bins]))
+    assert_allclose(compute_irfft(spectrum, n=len(x)), x, atol=1e-9)
+    assert_allclose(compute_ifft(spectrum, n=len(x), real=True), x, atol=1e-9)
+    # Without real=True, a spectrum of n//2 + 1 bins is a truncated full spectrum
+    assert_allclose(compute_ifft(spectrum, n=len(x)), np.fft.ifft(spectrum, n=len(x)).real, atol=1e-9)
+    with pytest.raises(ValueError):
+        compute_fft(x.astype(np.complex128), real=True)
+
+def test_compute_fft_pad_to_fast():
+    """Test that pad_to_fast rounds a prime FFT length up to a fast length."""
+    fs = 1031.0 # Prime length signal
+    x = np.sin(2 * np.pi * 50.0 * np.arange(1031) / fs)
+    freqs, spectrum = compute_fft(x, fs=fs, window=None, pad_to_fast=True)
+    assert len(spectrum) == 1080 # 2**3 * 3**3 * 5 (real input: factors 2, 3, 5 only)
+    assert_allclose(freqs[1], fs / 1080)
+    freqs_r, spectrum_r = compute_fft(x, fs=fs, window=None, real=True, pad_to_fast=True)
+    assert len(spectrum_r) == 1080 // 2 + 1
+    assert_allclose(compute_irfft(spectrum_r, n=1080)[:len(x)], x, atol=1e-9)
+    _, spectrum_c = compute_fft(x.astype(np.complex128), fs=fs, window=None, pad_to_fast=True)
+    assert len(spectrum_c) == 1050 # 2 * 3 * 5**2 * 7 (complex input also allows 7 and 11)
+
+def test_compute_ifft_imag_check_only_in_debug(caplog):
+    """Test that the conjugate-symmetry warning is only evaluated with debug logging."""
+    import logging
+    asymmetric = np.array([0, 1, 0, 0], dtype=np.complex128) # Not conjugate-symmetric
+    with caplog.at_level(logging.INFO, logger="sygnals.core.dsp"):
+        compute_ifft(asymmetric)
+    assert "imaginary part" not in caplog.text
+    with caplog.at_level(logging.DEBUG, logger="sygnals.core.dsp"):
+        compute_ifft(asymmetric)
+    assert "imaginary part" in caplog.text
+
+def test_workers_argument_does_not_change_results(random_signal):
+    """Test that single-threaded and all-core transforms agree."""
+    x, fs = random_signal
+    kernel = np.hanning(31)
+    assert_allclose(compute_fft(x, fs=fs, workers=1)[1], compute_fft(x, fs=fs)[1])
+    assert_allclose(compute_stft(x, n_fft=512, workers=1), compute_stft(x, n_fft=512))
+    assert_allclose(apply_convolution(x, kernel, workers=1), apply_convolution(x, kernel))
+    assert_allclose(compute_correlation(x, x[:500], workers=1), compute_correlation(x, x[:500]))
+    assert_allclose(compute_psd_welch(x, fs=fs, workers=1)[1], compute_psd_welch(x, fs=fs)[1])
+    assert_allclose(compute_psd_welch(x, fs=fs, detrend='linear', workers=1)[1],
+                    compute_psd_welch(x, fs=fs, detrend='linear')[1])
+
+def test_scratch_buffers_reused_per_thread(random_signal):
+    """Test the per-thread scratch registry and that blocked results do not alias it."""
+    import threading
+    from sygnals.core import dsp
+    buf = dsp._get_scratch((4, 8), np.float32)
+    assert dsp._get_scratch((4, 8), np.float32) is buf
+    assert dsp._get_scratch((4, 8), np.float64) is not buf
+    other = []
+    worker = threading.Thread(target=lambda: other.append(dsp._get_scratch((4, 8), np.float32)))
+    worker.start()
+    worker.join()
+    assert other[0] is not buf
+    x, fs = random_signal
+    first = compute_psd_welch(x, fs=fs, nperseg=64)[1]
+    expected = first.copy()
+    compute_psd_welch(x[::-1].copy(), fs=fs, nperseg=64) # Reuses the segment block
+    assert_array_equal(first, expected)
+
+def test_scratch_memory_bounded_across_signal_lengths():
+    """Test that calls on many different signal lengths keep the pooled memory capped."""
+    from sygnals.core import dsp
+    for i in range(12):
+        y = np.random.randn(200_000 + 997 * i)
+        stft = compute_stft(y, n_fft=2048, hop_length=512)
+        compute_stft(y, n_fft=2048, hop_length=512, out=np.empty_like(stft))
+        compute_psd_welch(y, nperseg=1024 + i)
+        compute_psd_periodogram(y)
+        compute_fft(y)
+    held = sum(b.nbytes for b in dsp._scratch.buffers.values())
+    assert held <= dsp._SCRATCH_MAX_BYTES
+    # Only fixed-size blocks are pooled, never signal-sized intermediates
+    assert all(b.shape[0] <= dsp._FRAME_BLOCK_SIZE for b in dsp._scratch.buffers.values())
+
+def test_device_argument_validation(random_signal):
+    """Test that unknown devices are rejected and 'cuda' needs CuPy."""
+    x, fs = random_signal
+    with pytest.raises(ValueError):
+        compute_fft(x, device='gpu')
+    if not _CUPY_AVAILABLE:
+        with pytest.raises(ImportError):
+            compute_stft(x, n_fft=256, device='cuda')
+
+@pytest.mark.skipif(not _CUPY_AVAILABLE, reason="CuPy not installed, skipping CUDA tests")
+def test_cuda_device_matches_cpu(random_signal):
+    """Test the cuFFT paths against the CPU results, for host and device inputs."""
+    import cupy as cp
+    x, fs = random_signal
+    kernel = np.hanning(101)
+    freqs, spectrum = compute_fft(x, fs=fs, real=True, device='cuda')
+    assert isinstance(spectrum, np.ndarray)
+    assert_allclose(spectrum, compute_fft(x, fs=fs, real=True)[1], atol=1e-9)
+    assert_allclose(freqs, compute_fft(x, fs=fs, real=True)[0])
+    assert_allclose(compute_stft(x, n_fft=256, device='cuda'), compute_stft(x, n_fft=256), atol=1e-9)
+    for mode in ('full', 'same', 'valid'):
+        assert_allclose(apply_convolution(x, kernel, mode=mode, device='cuda'),
+                        apply_convolution(x, kernel, mode=mode), atol=1e-9)
+        assert_allclose(compute_correlation(x, x[:300], mode=mode, device='cuda'),
+                        compute_correlation(x, x[:300], mode=mode), atol=1e-9)
+    on_gpu = compute_stft(cp.asarray(x), n_fft=256, device='cuda')
+    assert isinstance(on_gpu, cp.ndarray)
+
 # --- Test compute_stft ---
 def test_compute_stft(sine_wave):
     """Test STFT computation."""
@@ -90,6 +284,50 @@ def test_compute_stft(sine_wave):
     mean_energy_per_frame = np.mean(np.abs(stft_matrix)**2, axis=1) # Average energy across time frames
     assert np.argmax(mean_energy_per_frame) == expected_bin # Max energy should be at the expected bin
 
+@pytest.mark.parametrize("kwargs", [
+    dict(n_fft=512),
+    dict(n_fft=512, hop_length=100, window='hamming', pad_mode='reflect'),
+    dict(n_fft=512, win_length=300, center=False),
+])
+def test_compute_stft_matches_librosa(random_signal, kwargs):
+    """Test the batched rfft STFT against librosa.stft."""
+    x, fs = random_signal
+    assert_allclose(compute_stft(x, **kwargs), librosa.stft(x, **kwargs), atol=1e-9)
+
+@pytest.mark.parametrize("pad_mode", ['constant', 'reflect', 'edge'])
+@pytest.mark.parametrize("n_fft, hop_length", [(256, 64), (16, 64), (255, 7), (4, 3)])
+def test_compute_stft_center_frames_without_full_pad(pad_mode, n_fft, hop_length):
+    """Test that head/interior/tail framing equals framing the fully padded signal."""
+    from numpy.lib.stride_tricks import sliding_window_view
+    from sygnals.core.dsp import _stft_frame_segments
+    y = np.random.randn(1001)
+    padded = np.pad(y, n_fft // 2, mode=pad_mode)
+    expected = sliding_window_view(padded, n_fft)[::hop_length]
+    segments = _stft_frame_segments(y, n_fft, hop_length, True, pad_mode)
+    assert_array_equal(np.concatenate(segments), expected)
+    assert np.shares_memory(segments[len(segments) // 2], y) # Interior frames are views of y
+
+def test_compute_stft_out_buffer(random_signal):
+    """Test that compute_stft fills and returns a caller-provided buffer."""
+    x, fs = random_signal
+    expected = compute_stft(x, n_fft=64, hop_length=2) # > 256 frames to cover blocking
+    out = np.empty_like(expected)
+    result = compute_stft(x, n_fft=64, hop_length=2, out=out)
+    assert result is out
+    assert_allclose(out, expected)
+    with pytest.raises(ValueError):
+        compute_stft(x, n_fft=64, hop_length=2, out=np.empty((10, 10), dtype=np.complex128))
+
+def test_compute_stft_rejects_non_positive_hop(random_signal):
+    """Test that compute_stft raises ValueError for hop_length < 1."""
+    x, fs = random_signal
+    with pytest.raises(ValueError, match="hop_length"):
+        compute_stft(x, n_fft=64, hop_length=0)
+    with pytest.raises(ValueError, match="hop_length"):
+        compute_stft(x, n_fft=64, hop_length=-4, out=np.empty((33, 10), dtype=np.complex128))
+    with pytest.raises(ValueError, match="hop_length"):
+        compute_stft(x, n_fft=2, win_length=2) # default hop = win_length // 4 == 0
+
 # --- Test compute_cqt ---
 def test_compute_cqt(chirp_signal):
     """Test CQT computation on a chirp signal."""
@@ -105,6 +343,54 @@ def test_compute_cqt(chirp_signal):
     # Allow for small dips (-1) due to algorithm specifics
     assert np.all(np.diff(energy_profile[len(energy_profile)//4:-len(energy_profile)//4]) >= -1)
 
+def test_compute_cqt_kernel_method(chirp_signal):
+    """Test the cached-kernel CQT against librosa.cqt and its kernel cache."""
+    from sygnals.core.dsp import _cqt_kernels
+    x, fs = chirp_signal
+    expected = compute_cqt(x, sr=fs, n_bins=48, bins_per_octave=12)
+    _cqt_kernels.cache_clear()
+    cqt_matrix = compute_cqt(x, sr=fs, n_bins=48, bins_per_octave=12, method='kernel')
+    compute_cqt(x, sr=fs, n_bins=48, bins_per_octave=12, method='kernel')
+    assert _cqt_kernels.cache_info().hits == 1
+    assert cqt_matrix.shape == expected.shape
+    assert cqt_matrix.dtype == np.complex128
+    # Full-rate filtering differs slightly from librosa's multirate implementation
+    assert np.max(np.abs(np.abs(cqt_matrix) - np.abs(expected))) < 0.05 * np.max(np.abs(expected))
+    with pytest.raises(ValueError):
+        compute_cqt(x, sr=fs, method='unknown')
+
+def test_compute_cqt_kernel_method_tuning_and_fallback(monkeypatch):
+    """Test that tuning=None estimates the tuning and unhashable parameters use librosa.cqt."""
+    sr = 8000
+    y = librosa.tone(452.0, sr=sr, duration=1.0) # Roughly 0.4 semitones sharp of A4
+    expected = librosa.cqt(y, sr=sr, n_bins=48, tuning=None)
+    cqt_matrix = compute_cqt(y, sr=sr, n_bins=48, method='kernel', tuning=None)
+    assert np.max(np.abs(np.abs(cqt_matrix) - np.abs(expected))) < 0.05 * np.max(np.abs(expected))
+    calls = []
+    monkeypatch.setattr(librosa, "cqt", lambda **kwargs: calls.append(kwargs) or expected)
+    window = np.hanning(64) # Arrays cannot key the filter bank cache
+    assert compute_cqt(y, sr=sr, n_bins=48, method='kernel', window=window) is expected
+    assert calls[0]["window"] is window
+
+@pytest.mark.parametrize("norm", [1, 2, None])
+def test_compute_cqt_kernel_method_norm(norm):
+    """Test that every norm matches librosa.cqt octave by octave on white noise."""
+    sr = 22050
+    y = np.random.default_rng(0).standard_normal(2 * sr)
+    expected = np.abs(librosa.cqt(y, sr=sr, n_bins=84, norm=norm))
+    cqt_matrix = np.abs(compute_cqt(y, sr=sr, n_bins=84, method='kernel', norm=norm))
+    octave_ratio = cqt_matrix.reshape(7, -1).mean(axis=1) / expected.reshape(7, -1).mean(axis=1)
+    assert_allclose(octave_ratio, 1.0, rtol=0.02)
+
+def test_compute_cqt_kernel_method_single_bin():
+    """Test that a single-bin kernel CQT matches librosa.cqt."""
+    sr = 22050
+    y = librosa.tone(440.0, sr=sr, duration=1.0)
+    expected = librosa.cqt(y, sr=sr, n_bins=1, fmin=440.0)
+    cqt_matrix = compute_cqt(y, sr=sr, n_bins=1, fmin=440.0, method='kernel')
+    assert cqt_matrix.shape == expected.shape
+    assert np.max(np.abs(np.abs(cqt_matrix) - np.abs(expected))) < 0.05 * np.max(np.abs(expected))
+
 # --- Test apply_convolution ---
 def test_apply_convolution_simple():
     """Test simple 1D convolution."""
@@ -114,6 +400,55 @@ def test_apply_convolution_simple():
     y_np = np.convolve(x, kernel, mode='same') # Compare with numpy's convolution
     assert_allclose(y, y_np, atol=1e-9)
 
+@pytest.mark.parametrize("mode", ['full', 'same', 'valid'])
+@pytest.mark.parametrize("kernel_len", [6, 7, 64, 1500])
+def test_apply_convolution_matches_scipy(random_signal, mode, kernel_len):
+    """Test convolution against scipy for all modes, including kernels longer than the data."""
+    from scipy.signal import fftconvolve
+    from sygnals.core import dsp
+    x, fs = random_signal
+    kernel = np.random.randn(kernel_len)
+    expected = fftconvolve(x, kernel, mode=mode)
+    dsp._kernel_spectra.clear()
+    assert_allclose(apply_convolution(x, kernel, mode=mode), expected, atol=1e-9)
+    # Short kernels are convolved directly; only the rfft path caches the kernel spectrum
+    uses_rfft = kernel_len > dsp._DIRECT_CONV_MAX_KERNEL
+    assert len(dsp._kernel_spectra) == (1 if uses_rfft else 0)
+    # Second call: the rfft path reuses the cached spectrum instead of adding one
+    assert_allclose(apply_convolution(x, kernel, mode=mode), expected, atol=1e-9)
+    assert len(dsp._kernel_spectra) == (1 if uses_rfft else 0)
+
+def test_kernel_spectrum_cache_is_bounded():
+    """Test that kernel spectra are reused by content, and that the cache stays small."""
+    from sygnals.core import dsp
+    dsp._kernel_spectra.clear()
+    kernel = np.random.randn(100)
+    first = dsp._cached_kernel_rfft(kernel, 1024)
+    assert dsp._cached_kernel_rfft(kernel.copy(), 1024) is first # Same contents, new array
+    assert dsp._cached_kernel_rfft(kernel[::-1], 1024) is not first
+    dsp._cached_kernel_rfft(kernel, 1 << 20) # Long transform: computed, not cached
+    assert all(key[2] == 1024 for key in dsp._kernel_spectra)
+    for n_fft in range(2048, 2048 + 40):
+        dsp._cached_kernel_rfft(kernel, n_fft)
+    assert len(dsp._kernel_spectra) == dsp._KERNEL_CACHE_MAX_ENTRIES
+
+@pytest.mark.parametrize("mode", ['full', 'same', 'valid'])
+def test_apply_convolution_overlap_add_for_long_signals(monkeypatch, mode):
+    """Test that medium kernels on long signals go through oaconvolve and match scipy."""
+    import sygnals.core.dsp as dsp
+    real_oaconvolve = dsp.oaconvolve
+    calls = []
+    def spy(*args, **kwargs):
+        calls.append(args[1].size)
+        return real_oaconvolve(*args, **kwargs)
+    monkeypatch.setattr(dsp, "oaconvolve", spy)
+    x = np.random.randn(20000)
+    kernel = np.random.randn(257)
+    assert_allclose(apply_convolution(x, kernel, mode=mode), np.convolve(x, kernel, mode=mode), atol=1e-9)
+    assert calls == [257]
+    apply_convolution(x[:1000], kernel, mode=mode) # Too short for overlap-add
+    assert calls == [257]
+
 # --- Test Correlation ---
 def test_compute_correlation():
     """Test cross-correlation calculation."""
@@ -125,6 +460,17 @@ def test_compute_correlation():
     # Since x and y align, peak should be at zero lag (index 4)
     assert np.argmax(corr_full) == 4, f"Peak expected at index 4, found at {np.argmax(corr_full)}"
 
+@pytest.mark.parametrize("mode", ['full', 'same', 'valid'])
+@pytest.mark.parametrize("y_len", [100, 1000, 1500])
+def test_compute_correlation_rfft_matches_scipy(random_signal, mode, y_len):
+    """Test the real-FFT correlation path against scipy.signal.correlate."""
+    from scipy.signal import correlate
+    x, fs = random_signal
+    y = np.random.randn(y_len)
+    expected = correlate(x, y, mode=mode, method='direct')
+    assert_allclose(compute_correlation(x, y, mode=mode, method='fft'), expected, atol=1e-9)
+    assert_allclose(compute_correlation(x, y, mode=mode, method='auto'), expected, atol=1e-9)
+
 def test_compute_autocorrelation(sine_wave):
     """Test auto-correlation calculation."""
     x, fs, freq = sine_wave
@@ -168,6 +514,32 @@ def test_compute_psd_welch(sine_wave):
     peak_freq_idx = np.argmax(Pxx)
     assert abs(f[peak_freq_idx] - freq) < 1.0
 
+@pytest.mark.parametrize("kwargs", [
+    dict(nperseg=256),
+    dict(nperseg=300, noverlap=100, nfft=513, scaling='spectrum'),
+    dict(nperseg=256, detrend=False, window='hamming'),
+    dict(nperseg=256, detrend='linear'), # Delegated to scipy
+])
+def test_compute_psd_welch_matches_scipy(random_signal, kwargs):
+    """Test the fused detrend/window Welch PSD against scipy.signal.welch."""
+    from scipy.signal import welch
+    x, fs = random_signal
+    x = x + 2.0 # Non-zero mean so detrending matters
+    f, Pxx = compute_psd_welch(x, fs=fs, **kwargs)
+    f_ref, Pxx_ref = welch(x, fs=fs, **{'window': 'hann', **kwargs})
+    assert_allclose(f, f_ref)
+    assert_allclose(Pxx, Pxx_ref, rtol=1e-10, atol=1e-14)
+
+@pytest.mark.parametrize("nfft", [None, 1200, 801])
+def test_compute_psd_periodogram_matches_scipy(random_signal, nfft):
+    """Test the fused periodogram against scipy.signal.periodogram, including padding and truncation."""
+    from scipy.signal import periodogram
+    x, fs = random_signal
+    f, Pxx = compute_psd_periodogram(x + 2.0, fs=fs, nfft=nfft)
+    f_ref, Pxx_ref = periodogram(x + 2.0, fs=fs, window='hann', nfft=nfft)
+    assert_allclose(f, f_ref)
+    assert_allclose(Pxx, Pxx_ref, rtol=1e-10, atol=1e-14)
+
 # --- Test Envelope ---
 def test_amplitude_envelope_hilbert(sine_wave):
     """Test Hilbert amplitude envelope calculation."""
@@ -180,6 +552,23 @@ def test_amplitude_envelope_hilbert(sine_wave):
     assert_allclose(np.mean(envelope), 1.0, atol=0.05) # Mean should be close to 1.0
     assert np.all(envelope >= 0) # Envelope should be non-negative
 
+def test_amplitude_envelope_hilbert_matches_scipy(random_signal):
+    """Test the rfft-based Hilbert envelope against scipy.signal.hilbert."""
+    from scipy.signal import hilbert
+    x, fs = random_signal
+    assert_allclose(amplitude_envelope(x, method='hilbert'), np.abs(hilbert(x)), atol=1e-9)
+    x_odd = x[:375] # Odd length: no Nyquist bin
+    assert_allclose(amplitude_envelope(x_odd, method='hilbert'), np.abs(hilbert(x_odd)), atol=1e-9)
+    x_prime = x[:997] # Not padded unless requested, so still identical to scipy
+    assert_allclose(amplitude_envelope(x_prime, method='hilbert'), np.abs(hilbert(x_prime)), atol=1e-9)
+    # Zero-padding to a fast length changes the boundary condition: the length is kept,
+    # but values deviate from scipy (see the pad_to_fast docs)
+    padded = amplitude_envelope(x_prime, method='hilbert', pad_to_fast=True)
+    assert padded.shape == x_prime.shape
+    assert not np.allclose(padded, np.abs(hilbert(x_prime)), atol=1e-6)
+    # With a length that is already fast, pad_to_fast is a no-op
+    assert_allclose(amplitude_envelope(x, method='hilbert', pad_to_fast=True), np.abs(hilbert(x)), atol=1e-9)
+
 def test_amplitude_envelope_rms(sine_wave):
     """Test RMS amplitude envelope calculation."""
     # Fixture sine wave has amplitude 1.0
@@ -198,6 +587,26 @@ def test_amplitude_envelope_rms(sine_wave):
     assert_allclose(np.mean(envelope), expected_rms, atol=0.05)
     assert np.all(envelope >= 0) # RMS should be non-negative
 
+def test_amplitude_envelope_rms_rejects_non_positive_lengths(random_signal):
+    """Test that the RMS envelope raises ValueError for hop_length or frame_length < 1."""
+    x, fs = random_signal
+    with pytest.raises(ValueError, match="hop_length"):
+        amplitude_envelope(x, method='rms', frame_length=256, hop_length=0)
+    with pytest.raises(ValueError, match="frame_length"):
+        amplitude_envelope(x, method='rms', frame_length=0, hop_length=128)
+
+def test_amplitude_envelope_rms_numba_matches_rms_energy(monkeypatch, random_signal):
+    """Test the Numba RMS loop against rms_energy when it is forced on."""
+    from sygnals.core import dsp
+    if not dsp._NUMBA_AVAILABLE:
+        pytest.skip("Numba not installed")
+    x, fs = random_signal
+    monkeypatch.setattr(dsp, "_RMS_NUMBA_MIN_WORK", 0)
+    envelope = amplitude_envelope(x, method='rms', frame_length=256, hop_length=100)
+    expected = rms_energy(x, frame_length=256, hop_length=100, center=True)
+    assert envelope.dtype == np.float64
+    assert_allclose(envelope, expected, rtol=1e-5) # librosa accumulates in float32
+
 # --- Test apply_window ---
 def test_apply_window_types(random_signal):
     """Test applying different window types."""
@@ -209,3 +618,37 @@ def test_apply_window_types(random_signal):
     assert x_hamming.shape == x.shape
     assert not np.allclose(x_hann, x) # Windowed signal should differ from original
     assert not np.allclose(x_hann, x_hamming) # Different windows should produce different results
+
+def test_apply_window_uses_cached_window(random_signal):
+    """Test that repeated windowing reuses one read-only window array."""
+    from sygnals.core.dsp import _cached_window
+    x, fs = random_signal
+    w1 = _cached_window('hann', len(x))
+    w2 = _cached_window('hann', len(x))
+    assert w1 is w2
+    assert not w1.flags.writeable
+    assert_allclose(apply_window(x, window_type='hann'), x * w1)
+    with pytest.raises(ValueError):
+        apply_window(x, window_type='not_a_window')
+
+def test_unhashable_window_spec_raises(random_signal):
+    """Test that unhashable window specs bypass the cache and still raise ValueError."""
+    x, fs = random_signal
+    with pytest.raises(ValueError, match="Invalid window type"):
+        apply_window(x, window_type=['kaiser', 5.0])
+    with pytest.raises(ValueError, match="Invalid window type"):
+        compute_fft(x, fs, window=['kaiser', 5.0])
+
+def test_apply_window_out_buffer(random_signal):
+    """Test windowing into a caller-provided buffer, leaving the input untouched."""
+    x, fs = random_signal
+    x_orig = x.copy()
+    out = np.empty_like(x)
+    result = apply_window(x, window_type='hann', out=out)
+    assert result is out
+    assert_allclose(out, apply_window(x, window_type='hann'))
+    # compute_fft windows into a private buffer, so the caller's data is not overwritten
+    compute_fft(x, window='hann')
+    assert_array_equal(x, x_orig)
+    with pytest.raises(ValueError):
+        apply_window(x, out=np.empty(len(x) + 1))